@@ -1,19 +1,44 @@
-import tkinter as tk
-from tkinter import messagebox
+import argparse
+import logging
 
-import my_libs.terapeak.terapeak_data_extraction as terapeak
 from my_libs.logging_config import setup_logging
-from my_libs.utils import get_output_directory
 
 TXT_FILE = "Keywords.txt"
-OUTPUT_FOLDER = get_output_directory(".")
+OUTPUT_BASE_FOLDER = "."
 
 
-def prompt_for_keywords_from_txt():
-    """Create a TXT file and notify the user to enter keywords manually."""
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(description="eBay Terapeak Scraper")
+    parser.add_argument(
+        "--no-gui",
+        action="store_true",
+        help="Log notifications instead of showing dialog boxes (for headless/batch runs).",
+    )
+    return parser.parse_args()
+
+
+def notify_user(title: str, message: str, use_gui: bool, warning: bool = False):
+    """Show a dialog box, or log the message when running without a GUI."""
+    if not use_gui:
+        logging.log(logging.WARNING if warning else logging.INFO, message)
+        return
+
+    # Imported lazily so headless runs never load tkinter
+    import tkinter as tk
+    from tkinter import messagebox
+
     root = tk.Tk()
     root.withdraw()  # Hide the root window
+    if warning:
+        messagebox.showwarning(title, message)
+    else:
+        messagebox.showinfo(title, message)
+    root.destroy()
+
 
+def prompt_for_keywords_from_txt(use_gui: bool = True):
+    """Create a TXT file and notify the user to enter keywords manually."""
     # Create the TXT file with a note and examples
     with open(TXT_FILE, mode="w") as file:
         file.write("# Enter your keywords here, one per line.\n")
@@ -23,56 +48,66 @@ def prompt_for_keywords_from_txt():
         file.write("# 15643-31050\n")
 
     # Notify the user
-    messagebox.showinfo(
+    notify_user(
         "TXT File Created",
-        f"TXT file '{TXT_FILE}' has been created. Please open this file and enter your keywords manually."
+        f"TXT file '{TXT_FILE}' has been created. Please open this file and enter your keywords manually.",
+        use_gui,
     )
 
 
-def read_keywords_from_txt():
+def read_keywords_from_txt(use_gui: bool = True):
     """Read keywords from the TXT file."""
-    keywords = []
-
     try:
-        with open(TXT_FILE, mode="r") as file:
-            for line in file:
-                # Strip leading and trailing whitespaces
-                keyword = line.strip()
-                # Skip lines that start with '#' or are empty
-                if keyword and not keyword.startswith("#"):
-                    keywords.append(keyword)
+        # Read the whole file at once and split it in a single pass
+        with open(TXT_FILE, mode="r", encoding="utf-8") as file:
+            data = file.read()
     except FileNotFoundError:
         # File not found, so create it
-        prompt_for_keywords_from_txt()
+        prompt_for_keywords_from_txt(use_gui)
         return []
     except Exception as e:
         raise RuntimeError(
             f"An error occurred while reading the TXT file: {e}"
         )
 
-    return keywords
+    # Strip whitespace and skip lines that are empty or start with '#'
+    keywords = [
+        keyword
+        for keyword in (line.strip() for line in data.splitlines())
+        if keyword and keyword[0] != "#"
+    ]
+    # Drop duplicate keywords while preserving their original order
+    return list(dict.fromkeys(keywords))
 
 
-def run_terapeak_scraper():
+def run_terapeak_scraper(use_gui: bool = True):
     """Run the eBay Terapeak scraper."""
-    keywords = read_keywords_from_txt()
+    keywords = read_keywords_from_txt(use_gui)
     if not keywords:
-        messagebox.showwarning(
+        notify_user(
             "No Keywords Found",
-            "No keywords found in the TXT file. Please add keywords and run the program again."
+            "No keywords found in the TXT file. Please add keywords and run the program again.",
+            use_gui,
+            warning=True,
         )
         return
 
-    terapeak.process_keywords(keywords, OUTPUT_FOLDER)
-    messagebox.showinfo(
+    # Imported lazily so early exits don't pay for loading Selenium and friends
+    import my_libs.terapeak.terapeak_data_extraction as terapeak
+    from my_libs.utils import get_output_directory
+
+    terapeak.process_keywords(keywords, get_output_directory(OUTPUT_BASE_FOLDER))
+    notify_user(
         "eBay Terapeak Scraper",
-        "eBay Terapeak scraper execution completed."
+        "eBay Terapeak scraper execution completed.",
+        use_gui,
     )
 
 
 def main():
+    args = parse_args()
     setup_logging()
-    run_terapeak_scraper()
+    run_terapeak_scraper(use_gui=not args.no_gui)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,45 @@
 import logging
 import os
 from datetime import datetime
+from logging.handlers import MemoryHandler
+
+LOG_FILE_BUFFER_SIZE = 1 << 16
+
+# Third-party loggers whose debug output is suppressed. Child loggers (e.g. all of
+# "selenium.*") inherit the level from these parents.
+SUPPRESSED_LIBRARIES = (
+    "requests",
+    "urllib3",
+    "PIL",
+    "concurrent.futures",
+    "selenium",
+)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A file handler that writes through a large buffer instead of flushing after every record.
+
+    The buffer is flushed on ERROR records and when the handler is closed.
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_FILE_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            super().flush()
+
+    def flush(self) -> None:
+        # Left to the write buffer; see emit() and close()
+        pass
 
 
 def setup_logging() -> None:
@@ -16,8 +55,7 @@ def setup_logging() -> None:
     os.makedirs(logs_dir, exist_ok=True)
 
     # Generate a log file name with a timestamp to ensure unique filenames for each run
-    current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    log_file = os.path.join(logs_dir, f"log_{current_time}.log")
+    log_file = f"{logs_dir}/log_{datetime.now():%Y-%m-%d_%H-%M-%S}.log"
 
     # Set up the root logger
     root_logger = logging.getLogger()
@@ -31,7 +69,7 @@ def setup_logging() -> None:
 
     # File handler
     try:
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = BufferedFileHandler(log_file, encoding="utf-8", delay=True)
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
         file_handler.setFormatter(file_formatter)
@@ -39,21 +77,24 @@ def setup_logging() -> None:
         print(f"Failed to create log file: {e}")
         return
 
+    # Buffer file records so they are written in batches instead of one write per record.
+    # The buffer is flushed when full, on ERROR records, and on shutdown.
+    buffered_file_handler = MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
+
     # Remove existing handlers and add new ones
     if root_logger.handlers:
         root_logger.handlers.clear()
     root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_file_handler)
 
     # Suppress debug logs from specific third-party libraries
-    suppressed_libraries = [
-        "requests",
-        "urllib3",
-        "PIL",
-        "concurrent.futures",
-        "selenium.webdriver.remote.remote_connection",
-    ]
-    for library in suppressed_libraries:
+    for library in SUPPRESSED_LIBRARIES:
         logging.getLogger(library).setLevel(logging.WARNING)
 
     logging.info("Logging set up successfully. Logs will be written to: %s", log_file)
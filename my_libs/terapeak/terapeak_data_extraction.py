@@ -1,8 +1,11 @@
+import asyncio
 import concurrent
 import logging
 import os
 import time
-from threading import Lock
+from collections import deque
+from datetime import datetime
+from operator import itemgetter
 from typing import Any, Callable, Optional
 
 import dateutil.parser as dparser
@@ -21,6 +24,63 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 MAX_SCRAPE_ROW = 500
+IMAGE_DOWNLOAD_WORKERS = 16
+WORKBOOK_SAVE_WORKERS = 2
+FETCH_ROWS_TIMEOUT = 20
+# Strips the "$" and thousands separators from currency and count texts in a single pass
+CURRENCY_STRIP_TABLE = str.maketrans("", "", "$,")
+# Terapeak shows dates like "Jan 05, 2024"; anything else falls back to the fuzzy parser
+DATE_SOLD_FORMAT = "%b %d, %Y"
+DATE_PARSER = dparser.parser()
+
+# TerapeakData members bound to plain globals for the per-row hot paths
+K_AVG_SHIPPING_COST = TerapeakData.AVG_SHIPPING_COST
+K_AVG_SOLD_PRICE = TerapeakData.AVG_SOLD_PRICE
+K_DATE_LAST_SOLD = TerapeakData.DATE_LAST_SOLD
+K_IMAGE_PATH = TerapeakData.IMAGE_PATH
+K_IMAGE_URL = TerapeakData.IMAGE_URL
+K_ITEM_SALES = TerapeakData.ITEM_SALES
+K_KEYWORD = TerapeakData.KEYWORD
+K_TITLE = TerapeakData.TITLE
+K_TITLE_HREF = TerapeakData.TITLE_HREF
+K_TOTAL_SOLD = TerapeakData.TOTAL_SOLD
+
+# Locators of the research page elements, built once at import
+RESULT_ROW_LOCATOR = (By.CSS_SELECTOR, "tr.research-table-row")
+NO_RESULTS_LOCATOR = (By.CSS_SELECTOR, "div.research__generic-error")
+NO_RESULTS_TITLE_LOCATOR = (
+    By.CSS_SELECTOR,
+    "div.research__generic-error .page-notice__title",
+)
+# When set, images are downloaded in one asyncio batch after a keyword's pages are scraped
+# instead of on the shared thread pool (requires the optional `httpx[http2]` package)
+ASYNC_IMAGES = bool(os.environ.get("ASYNC_IMAGES"))
+# Screenshots of every result page are only taken when this is set
+TAKE_SCREENSHOTS = bool(os.environ.get("TERAPEAK_SCREENSHOTS"))
+
+# Reads the raw text and attribute values of every research table row (arguments[0]) in one call,
+# along with whether the "Next" page button is enabled. Missing elements are returned as null.
+ROWS_DATA_SCRIPT = """
+const nextButton = document.querySelector("button.pagination__next");
+const rows = arguments[0].map((row) => {
+    const find = (selector) => row.querySelector(selector);
+    const text = (selector) => { const el = find(selector); return el ? el.innerText.trim() : null; };
+    const attr = (selector, name) => { const el = find(selector); return el ? (el[name] ?? el.getAttribute(name)) : null; };
+    const cell = (column) => text(`td.research-table-row__${column}>div:first-child>div:first-child`);
+    return {
+        link_title: text("div.research-table-row__product-info-name a span"),
+        title: text("div.research-table-row__product-info-name"),
+        href: attr("div.research-table-row__product-info-name a", "href"),
+        image_url: attr("div.__zoomable-thumbnail-inner img", "src"),
+        avg_sold_price: cell("avgSoldPrice"),
+        avg_shipping_cost: cell("avgShippingCost"),
+        total_sold: cell("totalSoldCount"),
+        item_sales: cell("totalSalesValue"),
+        date_last_sold: cell("dateLastSold"),
+    };
+});
+return { rows: rows, has_next: !!nextButton && !nextButton.disabled };
+"""
 
 
 def process_keywords(keywords: list[str], output_dir: str) -> None:
@@ -43,8 +103,11 @@ def process_keywords(keywords: list[str], output_dir: str) -> None:
         - If no keywords are provided, the function logs a warning and skips the data fetch process.
         - The function ensures that an image folder is created or verified before starting the scraping process.
         - It uses a `ThreadPoolExecutor` to parallelize the scraping tasks, with a maximum of two concurrent workers.
-        - After all tasks are completed, it saves the results into Excel workbooks, and then deletes the temporary
-          image folder.
+          Each task scrapes a single result page, so the work of keywords with many pages is spread over all workers.
+        - Product images are downloaded concurrently on a separate, shared `ThreadPoolExecutor`.
+        - Each keyword workbook is saved on a background `ThreadPoolExecutor` as soon as both of its day ranges are
+          done, so closing the workbook overlaps with scraping the next keywords.
+        - After all tasks are completed, it saves the total workbook, and then deletes the temporary image folder.
     """
     if not keywords:
         logging.warning("No keywords provided. Skipping data fetch.")
@@ -55,19 +118,30 @@ def process_keywords(keywords: list[str], output_dir: str) -> None:
     product_images_folder_path = Utils.create_subfolder(
         output_dir, "Terapeak Product Images"
     )
-    screenshots_folder_path = Utils.create_subfolder(output_dir, "Terapeak Screenshots")
+    screenshots_folder_path = os.path.join(output_dir, "Terapeak Screenshots")
+    if TAKE_SCREENSHOTS:
+        Utils.create_subfolder(output_dir, "Terapeak Screenshots")
     logging.info("Image folder created or ensured at: %s", product_images_folder_path)
 
+    images_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=IMAGE_DOWNLOAD_WORKERS
+    )
+    save_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=WORKBOOK_SAVE_WORKERS
+    )
+    save_futures: list[concurrent.futures.Future] = []
+
     try:
         total_workbook = MyTerapeakExcel("All Terapeak Data", output_dir)
-        total_workbook_lock = Lock()
         max_workers = 2
 
         # Create a queue to hold the WebDriver instances
         driver_pool = Driver.DriverPool(max_workers)
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {}
+            # Tasks waiting for a free worker: (scraper, whether the task finishes the scraper)
+            ready_tasks: deque[tuple[KeywordScraper, bool]] = deque()
+            futures: dict[concurrent.futures.Future, tuple[KeywordScraper, bool]] = {}
             keyword_tasks = {}
 
             for keyword in keywords:
@@ -83,7 +157,7 @@ def process_keywords(keywords: list[str], output_dir: str) -> None:
                         output_dir,
                         product_images_folder_path,
                         screenshots_folder_path,
-                        total_workbook_lock,
+                        images_executor,
                     )
                     scraper_90 = KeywordScraper(
                         keyword,
@@ -93,60 +167,131 @@ def process_keywords(keywords: list[str], output_dir: str) -> None:
                         output_dir,
                         product_images_folder_path,
                         screenshots_folder_path,
-                        total_workbook_lock,
+                        images_executor,
                     )
 
-                    logging.info("Submitting tasks for search keyword: %s", keyword)
-
-                    # Submit tasks and store futures
-                    future_30 = executor.submit(
-                        scraper_30.scrape_keyword_data, driver_pool
-                    )
-                    futures[future_30] = scraper_30
-
-                    future_90 = executor.submit(
-                        scraper_90.scrape_keyword_data, driver_pool
-                    )
-                    futures[future_90] = scraper_90
+                    logging.info("Queueing tasks for search keyword: %s", keyword)
+                    ready_tasks.append((scraper_30, False))
+                    ready_tasks.append((scraper_90, False))
 
                     # Initialize tasks for keyword
-                    keyword_tasks[keyword] = {"30": False, "90": False}
+                    keyword_tasks[keyword] = {
+                        DaysRange.THIRTY: False,
+                        DaysRange.NINETY: False,
+                    }
                 else:
                     logging.warning("Empty search keyword encountered. Skipping.")
 
-            # Collect results as futures complete
-            for future in concurrent.futures.as_completed(futures):
-                scraper = futures[future]
-                keyword = scraper.keyword
-                days_range = scraper.days_range.value
-
-                try:
-                    if days_range == 30:
-                        keyword_tasks[keyword]["30"] = True
+            # Each task scrapes a single page, so a worker that finishes early picks up the next
+            # page of any keyword instead of idling. Follow-up tasks of a keyword are queued first
+            # so that keywords complete in order.
+            while ready_tasks or futures:
+                while ready_tasks and len(futures) < max_workers:
+                    scraper, finishing = ready_tasks.popleft()
+                    if finishing:
+                        future = executor.submit(scraper.finish_scraping)
                     else:
-                        keyword_tasks[keyword]["90"] = True
-                except Exception as e:
-                    logging.error(
-                        f"Error processing future result for {keyword} ({days_range} days): {e}"
-                    )
-                    continue
+                        future = executor.submit(scraper.scrape_next_page, driver_pool)
+                    futures[future] = (scraper, finishing)
 
-                # Save workbook only after both tasks for a keyword are complete
-                if keyword_tasks[keyword]["30"] and keyword_tasks[keyword]["90"]:
-                    logging.info(
-                        f"Both {keyword}'s days range task completed, saving workbook now..."
-                    )
-                    scraper.keyword_workbook.save_workbook()
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    scraper, finishing = futures.pop(future)
+                    keyword = scraper.keyword
+                    days_range = scraper.days
+
+                    if not finishing:
+                        try:
+                            has_more_pages = future.result()
+                        except Exception as e:
+                            logging.error(
+                                "Error processing future result for %s (%d days): %s",
+                                keyword,
+                                days_range,
+                                e,
+                            )
+                            has_more_pages = False
+                        # Scrape the next page, or finish once there are no more pages
+                        ready_tasks.appendleft((scraper, not has_more_pages))
+                        continue
+
+                    try:
+                        future.result()
+                        keyword_tasks[keyword][scraper.days_range] = True
+                    except Exception as e:
+                        logging.error(
+                            "Error processing future result for %s (%d days): %s",
+                            keyword,
+                            days_range,
+                            e,
+                        )
+                        continue
+
+                    # Save workbook only after both tasks for a keyword are complete
+                    if all(keyword_tasks[keyword].values()):
+                        logging.info(
+                            "Both %s's days range task completed, saving workbook now...",
+                            keyword,
+                        )
+                        # Saved in the background so scraping carries on meanwhile
+                        save_futures.append(
+                            save_executor.submit(scraper.keyword_workbook.save_workbook)
+                        )
 
+            # The total workbook embeds the images read by the keyword workbooks, so save it last
+            concurrent.futures.wait(save_futures)
             total_workbook.save_workbook()
         logging.info("All tasks completed successfully")
     except Exception as e:
-        logging.error(f"Error while processing keywords: {e}")
+        logging.error("Error while processing keywords: %s", e)
     finally:
         driver_pool.cleanup()
+        Driver.LoginDriverSingleton.close()
+        images_executor.shutdown(wait=True, cancel_futures=True)
+        # Workbooks still being saved read the product images, so wait before deleting them
+        save_executor.shutdown(wait=True)
+        MyTerapeakExcel.clear_image_cache()
         Utils.delete_folder(product_images_folder_path)
 
 
+class LazyLogMessage:
+    """
+    A log message argument that is only built when the logging record is formatted.
+
+    Passing it as a `%s` argument defers the formatting work until a handler actually emits the record.
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., str], *args: Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return self.func(*self.args)
+
+
+def parse_date_sold(text: str) -> datetime:
+    """
+    Parse a "date last sold" text from the research table.
+
+    Args:
+        text (str): The date text, usually formatted as "Jan 05, 2024".
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError: If the text cannot be parsed as a date.
+    """
+    try:
+        return datetime.strptime(text, DATE_SOLD_FORMAT)
+    except ValueError:
+        return DATE_PARSER.parse(text, fuzzy=True)
+
+
 class KeywordScraper:
     def __init__(
         self,
@@ -157,7 +302,7 @@ class KeywordScraper:
         output_dir: str,
         product_images_folder_path: str,
         screenshots_folder_path: str,
-        total_workbook_lock: Lock,
+        images_executor: concurrent.futures.ThreadPoolExecutor,
     ):
         """
         Initialize a KeywordScraper instance for scraping product data related to a specific keyword and day range.
@@ -168,12 +313,14 @@ class KeywordScraper:
             keyword_book (MyTerapeakExcel): An instance of MyTerapeakExcel for saving keyword-specific data.
             total_book (MyTerapeakExcel): An instance of MyTerapeakExcel for saving aggregated data across all keywords.
             output_dir (str): The directory path where data and images will be saved.
+            images_executor (concurrent.futures.ThreadPoolExecutor): The shared executor used to download product images.
 
         Returns:
             None: Initializes the scraper instance without returning any value.
         """
         self.keyword: str = keyword
         self.days_range: DaysRange = days_range
+        self.days: int = days_range.value
         self.keyword_workbook: MyTerapeakExcel = keyword_book
         self.total_workbook: MyTerapeakExcel = total_book
         self.output_dir: str = output_dir
@@ -181,90 +328,114 @@ class KeywordScraper:
         self.product_images_folder_path: str = product_images_folder_path
         self.screenshots_folder_path: str = screenshots_folder_path
         self.processed_rows: int = 0
-        self.total_workbook_lock: Lock = total_workbook_lock
-        self.logging_name: str = f"{self.keyword} Last {self.days_range.value} days"
-
-    def scrape_keyword_data(self, driver_pool: Driver.DriverPool) -> None:
+        self.total_sold_sum: int = 0
+        self.page_num: int = 0
+        self.has_next_page: bool = False
+        self.extracted_data: list[dict[TerapeakData, Any]] = []
+        self.images_executor: concurrent.futures.ThreadPoolExecutor = images_executor
+        self.pending_image_jobs: list[
+            tuple[dict[TerapeakData, Any], tuple[str, str, str]]
+        ] = []
+        self.logging_name: str = f"{self.keyword} Last {self.days} days"
+
+    def scrape_next_page(self, driver_pool: Driver.DriverPool) -> bool:
         """
-        Perform the scraping process for the given keyword and day range.
+        Scrape the next result page for the given keyword and day range.
+
+        This method navigates to the next page, handles CAPTCHA/login checks, fetches and processes the table rows and
+        queues the product image downloads. Pages of the same scraper must be scraped one after another.
 
-        This method handles the complete scraping workflow including initializing the web driver, navigating to the URL,
-        fetching and processing table rows, downloading images, and writing data to Excel workbooks. It also manages error handling
-        and ensures proper closing of the web driver.
+        Args:
+            driver_pool (Driver.DriverPool): The pool to acquire a web driver from.
 
         Returns:
-            None: This method does not return a value. It performs data scraping and processing, and manages the lifecycle of the
-                  web driver.
+            bool: True if there is another page to scrape, False once the scraper is done with its pages.
 
         Notes:
             - Handles the cookie management and captcha login processes.
-            - Collects data from each page and writes the processed data into workbooks.
-            - Ensures the web driver is closed properly in the `finally` block.
+            - Collects the page's data; it is written into the workbooks by `finish_scraping`.
+            - Ensures the web driver is released properly in the `finally` block.
         """
+        remaining_rows = MAX_SCRAPE_ROW - self.processed_rows
+        if remaining_rows <= 0:
+            logging.info("Reached maximum row limit of %d", MAX_SCRAPE_ROW)
+            return False
+
         try:
             self.driver = driver_pool.acquire()
-
-            url = Utils.build_terapeak_url(self.keyword, self.days_range.value)
+            self.page_num += 1
+
+            # Only request as many rows as are still needed on the last page
+            url = Utils.build_terapeak_url(
+                self.keyword,
+                self.days,
+                offset=self.processed_rows,
+                limit=min(remaining_rows, Utils.TERAPEAK_PAGE_SIZE),
+            )
             logging.debug("Navigating to URL: %s", url)
             self.driver.get(url)
 
-            all_extracted_data: list[dict[TerapeakData, Any]] = []
+            self.wait_for_page_ready(self.driver)
+            Driver.check_ebay_captcha(self.driver, url)
+            if TAKE_SCREENSHOTS:
+                screenshot_path = os.path.join(
+                    self.screenshots_folder_path,
+                    f"{self.logging_name} Page {self.page_num}.jpg",
+                )
+                Utils.take_screenshot(screenshot_path, self.driver)
+            logging.info(
+                "Fetching data for %s in page %d", self.logging_name, self.page_num
+            )
+            rows = self.fetch_table_rows(self.driver, url)
+            if not rows:
+                logging.info("No more rows found for %s.", self.logging_name)
+                return False
+            try:
+                processed_data = self.process_rows_data(self.driver, rows)
+                self.extracted_data.extend(processed_data)
+            except ValueError as ve:
+                logging.error(
+                    "Invalid data found while processing rows: %s. Stopping operation.",
+                    ve,
+                )
+                return False
 
-            page_num: int = 0
+            if not self.has_next_page:
+                logging.info("No more pages to scrape.")
+                return False
+            return self.processed_rows < MAX_SCRAPE_ROW
 
-            while self.processed_rows < MAX_SCRAPE_ROW:
-                try:
-                    page_num += 1
-                    Driver.check_ebay_captcha(self.driver, url)
-                    time.sleep(2)
-                    screenshot_path = os.path.join(
-                        self.screenshots_folder_path,
-                        f"{self.logging_name} Page {page_num}.png",
-                    )
-                    Utils.take_screenshot(screenshot_path, self.driver)
-                    logging.info(
-                        f"Fetching data for {self.logging_name} in page {page_num}"
-                    )
-                    rows = self.fetch_table_rows(self.driver, url)
-                    if not rows:
-                        logging.info(f"No more rows found for {self.logging_name}.")
-                        break
-                    try:
-                        processed_data = self.process_rows_data(rows)
-                        all_extracted_data.extend(processed_data)
-                    except ValueError as ve:
-                        logging.error(
-                            f"Invalid data found while processing rows: {ve}. Stopping operation."
-                        )
-                        break
+        except Exception as e:
+            logging.error(
+                "Error while processing rows for %s: %s", self.logging_name, e
+            )
+            return False
 
-                    if self.next_page_available(rows):
-                        url = Utils.build_terapeak_url(
-                            self.keyword,
-                            self.days_range.value,
-                            offset=self.processed_rows,
-                        )
-                        self.driver.get(url)
-                    else:
-                        break
+        finally:
+            if self.driver:
+                driver_pool.release(self.driver)
 
-                except Exception as e:
-                    logging.error(
-                        f"Error while processing rows for {self.logging_name}: {e}"
-                    )
-                    break  # Exit loop on error
+    def finish_scraping(self) -> None:
+        """
+        Write the data collected from all pages to the Excel workbooks.
+
+        This method waits for the product image downloads, sorts the collected data by average sold price and writes
+        it, along with the total number of items sold, to the keyword-specific and total workbooks.
+        """
+        try:
+            self.download_pending_images()
 
+            # parse_row_data guarantees every row has an average sold price
             sorted_data = sorted(
-                all_extracted_data,
-                key=lambda x: x.get(TerapeakData.AVG_SOLD_PRICE, 0),
+                self.extracted_data,
+                key=itemgetter(K_AVG_SOLD_PRICE),
                 reverse=True,
             )
             self.write_sorted_data(sorted_data)
 
-            total_sold_sum = self.calculate_total_sold(all_extracted_data)
-            self.write_total_sold(total_sold_sum)
+            self.write_total_sold(self.total_sold_sum)
             logging.info(
-                f"Wrote {self.processed_rows} rows of {self.logging_name} data."
+                "Wrote %d rows of %s data.", self.processed_rows, self.logging_name
             )
 
         except Exception as e:
@@ -274,10 +445,29 @@ class KeywordScraper:
                 e,
             )
 
-        finally:
-            # Ensure the WebDriver is properly closed
-            if self.driver:
-                driver_pool.release(self.driver)
+    def wait_for_page_ready(self, driver: webdriver.Chrome) -> None:
+        """
+        Wait until the research page shows its results, an error notice, or a CAPTCHA/login redirect.
+
+        This replaces a fixed sleep after navigation so the CAPTCHA check and row fetching start as soon as the
+        page is ready. A timeout is not an error here; `fetch_table_rows` retries on its own.
+
+        Args:
+            driver (webdriver.Chrome): The Selenium WebDriver instance used to interact with the webpage.
+        """
+        try:
+            WebDriverWait(driver, FETCH_ROWS_TIMEOUT).until(
+                EC.any_of(
+                    EC.presence_of_element_located(RESULT_ROW_LOCATOR),
+                    EC.presence_of_element_located(NO_RESULTS_LOCATOR),
+                    EC.url_contains("captcha"),
+                    EC.url_contains("signin"),
+                    EC.url_contains("limitexceeded"),
+                    EC.url_contains("authn-register"),
+                )
+            )
+        except TimeoutException:
+            logging.debug("Timed out waiting for the page of %s", self.logging_name)
 
     def fetch_table_rows(self, driver: webdriver.Chrome, url: str) -> list[WebElement]:
         """
@@ -297,40 +487,37 @@ class KeywordScraper:
             TimeoutException: If fetching the rows times out.
 
         Notes:
-            - Uses a timeout for fetching rows.
+            - Waits for the first row only, then fetches all rows with a single `find_elements` call.
+            - Uses a timeout for fetching rows and backs off exponentially between retries.
             - Logs errors if the rows cannot be found.
         """
         attempts, max_retries = 0, 5
 
         while attempts < max_retries:
             try:
-                # Wait for the presence of the research table rows
-                WebDriverWait(driver, 60).until(
-                    EC.presence_of_all_elements_located(
-                        (By.CSS_SELECTOR, "tr.research-table-row")
-                    )
+                # Wait for the first research table row; all rows are fetched once below
+                WebDriverWait(driver, FETCH_ROWS_TIMEOUT).until(
+                    EC.presence_of_element_located(RESULT_ROW_LOCATOR)
                 )
 
                 current_url = driver.current_url
                 if "tabName=ACTIVE" in current_url:
                     logging.info(
-                        f"Detected ACTIVE tab instead of SOLD for {self.logging_name}. Skipping data extraction."
+                        "Detected ACTIVE tab instead of SOLD for %s. Skipping data extraction.",
+                        self.logging_name,
                     )
                     return []
 
-                rows = driver.find_elements(By.CSS_SELECTOR, "tr.research-table-row")
+                rows = driver.find_elements(*RESULT_ROW_LOCATOR)
 
                 # If rows are found, return them early
                 if rows:
-                    logging.info(f"Fetched {len(rows)} rows from {self.logging_name}")
+                    logging.info("Fetched %d rows from %s", len(rows), self.logging_name)
                     return rows
 
                 # If no rows found, check for the error message
                 try:
-                    error_message = driver.find_element(
-                        By.CSS_SELECTOR,
-                        "div.research__generic-error .page-notice__title",
-                    )
+                    error_message = driver.find_element(*NO_RESULTS_TITLE_LOCATOR)
                     if "No sold results found" in error_message.text:
                         logging.info(
                             "No sold results found for keyword: %s", self.logging_name
@@ -339,7 +526,7 @@ class KeywordScraper:
 
                 except NoSuchElementException:
                     logging.error(
-                        f"No rows and no error message found: {self.logging_name}"
+                        "No rows and no error message found: %s", self.logging_name
                     )
                     raise Exception(
                         f"No results or error message found for {self.logging_name}"
@@ -347,23 +534,30 @@ class KeywordScraper:
 
             except (TimeoutException, NoSuchElementException) as e:
                 logging.error(
-                    f"Error fetching table rows for {self.logging_name}: {str(e)}",
+                    "Error fetching table rows for %s: %s",
+                    self.logging_name,
+                    e,
                     exc_info=True,
                 )
                 attempts += 1
-                if attempts <= max_retries:
+                if attempts < max_retries:
                     logging.info(
-                        f"Retrying to fetch table rows for {self.logging_name}... ({attempts} / {max_retries})"
+                        "Retrying to fetch table rows for %s... (%d / %d)",
+                        self.logging_name,
+                        attempts,
+                        max_retries,
                     )
+                    # Back off exponentially between retries
+                    time.sleep(2 ** (attempts - 1))
                     try:
                         driver.get(url)
                         Driver.check_ebay_captcha(driver, url)
                     except Exception as e:
                         logging.error(
-                            f"Error occurred when attempting to refresh driver: {e}"
+                            "Error occurred when attempting to refresh driver: %s", e
                         )
             except Exception as e:
-                logging.error(f"Unexpected error: {str(e)}")
+                logging.error("Unexpected error: %s", e)
                 return []
 
         logging.error(
@@ -374,7 +568,7 @@ class KeywordScraper:
         return []
 
     def process_rows_data(
-        self, rows: list[WebElement]
+        self, driver: webdriver.Chrome, rows: list[WebElement]
     ) -> list[dict[TerapeakData, Any]]:
         """
         Process table rows to extract data, download images, and return a list of dictionaries containing the extracted data.
@@ -383,154 +577,201 @@ class KeywordScraper:
         processed based on a predefined maximum limit.
 
         Args:
+            driver (webdriver.Chrome): The Selenium WebDriver instance the rows were fetched with.
             rows (list[WebElement]): A list of WebElement objects representing the rows of the research table.
 
         Returns:
             (list[dict[TerapeakDataKey, Any]]): A list of dictionaries where each dictionary contains the data for a single row.
 
         Notes:
-            - Handles image downloading and stores the path to each downloaded image.
+            - The raw data of all rows is read with a single `execute_script` call, which also records whether a
+              next page is available in `has_next_page`.
+            - All rows of the page are parsed before any state is updated, so a row raising `ValueError` discards
+              the whole page: `processed_rows` and `total_sold_sum` are only updated and the image downloads only
+              submitted once the page has been parsed.
+            - Submits image downloads to the shared images executor and stores the pending `Future` of each
+              image path; the paths are resolved in `write_sorted_data`.
             - Logs warnings for any issues encountered during data extraction.
         """
 
         extracted_data: list[dict[TerapeakData, Any]] = []
-        logging.info(f"Processing {len(rows)} rows for {self.logging_name}")
+        logging.info("Processing %d rows for %s", len(rows), self.logging_name)
+        if not rows:
+            return extracted_data
+
+        page_data: dict[str, Any] = driver.execute_script(ROWS_DATA_SCRIPT, rows)
+        raw_rows: list[dict[str, Optional[str]]] = page_data["rows"]
+        self.has_next_page = page_data["has_next"]
 
-        for index, row in enumerate(rows, start=self.processed_rows + 1):
-            if self.processed_rows >= MAX_SCRAPE_ROW:
-                logging.info(f"Reached maximum row limit of {MAX_SCRAPE_ROW}")
+        # Clean the titles and product URLs of the whole page in one pass per column
+        titles = Utils.escape_quotes_many(
+            [row.get("link_title") or row.get("title") for row in raw_rows]
+        )
+        hrefs = Utils.ebay_clean_product_url_many([row.get("href") for row in raw_rows])
+
+        page_total_sold = 0
+        image_jobs: list[tuple[dict[TerapeakData, Any], tuple[str, str, str]]] = []
+        for index, (row, title, href) in enumerate(
+            zip(raw_rows, titles, hrefs), start=self.processed_rows + 1
+        ):
+            if index > MAX_SCRAPE_ROW:
+                logging.info("Reached maximum row limit of %d", MAX_SCRAPE_ROW)
                 break
 
-            logging.debug(f"Processing row {index} for {self.logging_name}")
-            data = self.parse_row_data(row)
-            image_url = data.get(TerapeakData.IMAGE_URL)
-            image_path = (
-                Utils.download_image(
-                    image_url,
-                    self.product_images_folder_path,
-                    f"Terapeak_{self.logging_name.replace(' ', '_')}_{index}",
+            logging.debug("Processing row %d for %s", index, self.logging_name)
+            data = self.parse_row_data(row, title, href)
+            data[K_IMAGE_PATH] = None
+            image_url = data.get(K_IMAGE_URL)
+            if image_url:
+                image_jobs.append(
+                    (
+                        data,
+                        (
+                            image_url,
+                            self.product_images_folder_path,
+                            f"Terapeak_{self.logging_name.replace(' ', '_')}_{index}",
+                        ),
+                    )
                 )
-                if image_url
-                else None
-            )
-            data[TerapeakData.IMAGE_PATH] = image_path
-            self.processed_rows += 1
+            # parse_row_data guarantees every row has a total sold count
+            page_total_sold += data[K_TOTAL_SOLD]
             extracted_data.append(data)
-            logging.debug(f"Successfully processed row {index} for {self.logging_name}")
+            logging.debug(
+                "Successfully processed row %d for %s", index, self.logging_name
+            )
+
+        # The whole page was parsed, so record it and start its image downloads
+        if ASYNC_IMAGES:
+            self.pending_image_jobs.extend(image_jobs)
+        else:
+            for data, image_job in image_jobs:
+                data[K_IMAGE_PATH] = self.images_executor.submit(
+                    Utils.download_image, *image_job
+                )
+        self.total_sold_sum += page_total_sold
+        self.processed_rows += len(extracted_data)
 
         logging.info(
-            f"Finished processing {len(extracted_data)} rows for {self.logging_name}"
+            "Finished processing %d rows for %s",
+            len(extracted_data),
+            self.logging_name,
         )
         return extracted_data
 
-    def parse_row_data(self, row: WebElement) -> dict[TerapeakData, Any]:
+    def download_pending_images(self) -> None:
         """
-        Extract and parse data from a row element in the research table for a given keyword.
+        Download the images queued while processing rows in a single asyncio batch.
 
-        This method extracts various pieces of information from a row element, including title, average sold price, shipping cost,
+        Only used when `ASYNC_IMAGES` is enabled; the downloaded image paths are stored back into their rows.
+        Falls back to a thread pool batch if the optional `httpx` package is not installed.
+        """
+        if not self.pending_image_jobs:
+            return
+
+        logging.info(
+            "Downloading %d images for %s",
+            len(self.pending_image_jobs),
+            self.logging_name,
+        )
+        jobs = [job for _, job in self.pending_image_jobs]
+        try:
+            try:
+                image_paths = asyncio.run(Utils.download_images_async(jobs))
+            except ImportError:
+                logging.warning("httpx is not installed, downloading images on threads")
+                image_paths = Utils.download_images(jobs, IMAGE_DOWNLOAD_WORKERS)
+            for (data, _), image_path in zip(self.pending_image_jobs, image_paths):
+                data[K_IMAGE_PATH] = image_path
+        except Exception as e:
+            logging.error(
+                "Error while downloading images for %s: %s", self.logging_name, e
+            )
+        finally:
+            self.pending_image_jobs.clear()
+
+    def parse_row_data(
+        self,
+        raw_data: dict[str, Optional[str]],
+        title: Optional[str],
+        href: Optional[str],
+    ) -> dict[TerapeakData, Any]:
+        """
+        Parse the raw data of a row in the research table for a given keyword.
+
+        This method parses various pieces of information read from a row, including title, average sold price, shipping cost,
         and other details. It handles cases where certain data may be missing or not present.
 
         Args:
-            row (WebElement): The Selenium WebElement representing a row containing product data.
+            raw_data (dict[str, Optional[str]]): The raw texts and attributes of a row, as returned by `ROWS_DATA_SCRIPT`.
+            title (Optional[str]): The row's title with its quotes already escaped.
+            href (Optional[str]): The row's product URL with its query string already removed.
 
         Returns:
             (dict[TerapeakDataKey, Any]): A dictionary with `TerapeakDataKey` enum keys and their corresponding extracted values.
 
         Notes:
-            - Uses helper functions to safely extract text and attributes from elements.
             - Handles cases where elements might be missing or extraction fails.
             - Logs debug information about the extracted data.
         """
         data: dict[TerapeakData, Any] = {}
 
-        def safe_extract_text(
-            selector, transform_func: Callable[[str], Any] = str
-        ) -> Any:
+        def safe_transform(key: str, transform_func: Callable[[str], Any] = str) -> Any:
             """
-            Safely extract text from an element located by the CSS selector and transform it using a function.
+            Safely transform a raw value extracted from the row using a function.
 
             Args:
-                selector: The CSS selector to locate the element.
+                key: The key of the raw value in the extracted row data.
                 transform_func: Function to transform the extracted text.
 
             Returns:
-                Any: Transformed text or None if extraction fails.
+                Any: Transformed text or None if the value is missing or the transform fails.
             """
-            try:
-                element = row.find_element(By.CSS_SELECTOR, selector)
-                return transform_func(element.text)
-            except (NoSuchElementException, ValueError):
-                logging.debug("Failed to extract data for '%s'", selector)
+            text = raw_data.get(key)
+            if text is None:
+                logging.debug("Failed to extract data for '%s'", key)
                 return None
-
-        def safe_extract_attribute(selector, attribute_name) -> Any:
-            """
-            Safely extract an attribute value from an element located by the CSS selector.
-
-            Args:
-                selector: The CSS selector to locate the element.
-                attribute_name: The attribute name to extract.
-
-            Returns:
-                Any: The attribute value or None if extraction fails.
-
-            Raises:
-                ValueError: If the row data doesn't match expected sold listing data format
-            """
             try:
-                element = row.find_element(By.CSS_SELECTOR, selector)
-                return element.get_attribute(attribute_name)
-            except NoSuchElementException:
-                logging.debug(
-                    "Failed to extract attribute '%s' for '%s'",
-                    attribute_name,
-                    selector,
-                )
+                return transform_func(text)
+            except ValueError:
+                logging.debug("Failed to extract data for '%s'", key)
                 return None
 
-        data[TerapeakData.KEYWORD] = self.keyword
-        title = safe_extract_text("div.research-table-row__product-info-name a span")
-        if not title:
-            title = safe_extract_text("div.research-table-row__product-info-name")
-        else:
-            url = safe_extract_attribute(
-                "div.research-table-row__product-info-name a", "href"
-            )
-            data[TerapeakData.TITLE_HREF] = Utils.ebay_clean_product_url(url)
-            data[TerapeakData.IMAGE_URL] = safe_extract_attribute(
-                "div.__zoomable-thumbnail-inner img", "src"
-            )
-        data[TerapeakData.TITLE] = Utils.escape_quotes(title)
-        data[TerapeakData.AVG_SOLD_PRICE] = safe_extract_text(
-            "td.research-table-row__avgSoldPrice>div:first-child>div:first-child",
-            lambda text: float(text.replace(",", "").replace("$", "")),
+        data[K_KEYWORD] = self.keyword
+        # Only rows with a product link have a product URL and image
+        if raw_data.get("link_title"):
+            data[K_TITLE_HREF] = href
+            data[K_IMAGE_URL] = raw_data.get("image_url")
+        data[K_TITLE] = title
+        data[K_AVG_SOLD_PRICE] = safe_transform(
+            "avg_sold_price",
+            lambda text: float(text.translate(CURRENCY_STRIP_TABLE)),
         )
-        data[TerapeakData.AVG_SHIPPING_COST] = safe_extract_text(
-            "td.research-table-row__avgShippingCost>div:first-child>div:first-child",
-            lambda text: float(text.replace(",", "").replace("$", "")),
+        data[K_AVG_SHIPPING_COST] = safe_transform(
+            "avg_shipping_cost",
+            lambda text: float(text.translate(CURRENCY_STRIP_TABLE)),
         )
-        data[TerapeakData.TOTAL_SOLD] = safe_extract_text(
-            "td.research-table-row__totalSoldCount>div:first-child>div:first-child",
-            lambda text: int(text.replace(",", "")),
+        data[K_TOTAL_SOLD] = safe_transform(
+            "total_sold",
+            lambda text: int(text.translate(CURRENCY_STRIP_TABLE)),
         )
-        data[TerapeakData.ITEM_SALES] = safe_extract_text(
-            "td.research-table-row__totalSalesValue>div:first-child>div:first-child",
-            lambda text: float(text.replace(",", "").replace("$", "")),
+        data[K_ITEM_SALES] = safe_transform(
+            "item_sales",
+            lambda text: float(text.translate(CURRENCY_STRIP_TABLE)),
         )
-        date_last_sold = safe_extract_text(
-            "td.research-table-row__dateLastSold>div:first-child>div:first-child",
-            lambda text: dparser.parse(text, fuzzy=True),
+        date_last_sold = safe_transform(
+            "date_last_sold",
+            parse_date_sold,
         )
-        data[TerapeakData.DATE_LAST_SOLD] = Utils.convert_to_excel_date(date_last_sold)
+        data[K_DATE_LAST_SOLD] = Utils.convert_to_excel_date(date_last_sold)
 
         # if data[DataKey.TITLE_HREF]:
         #     get_additional_product_data(data)
 
-        logging.debug(f"Extracted data: {self.format_data_for_logging(data)}")
+        logging.debug("Extracted data: %s", self._format_lazy(data))
 
         if (
-            data[TerapeakData.AVG_SOLD_PRICE] is None
-            or data[TerapeakData.TOTAL_SOLD] is None
+            data[K_AVG_SOLD_PRICE] is None
+            or data[K_TOTAL_SOLD] is None
         ):
             raise ValueError(f"Invalid row data: Missing critical data.")
 
@@ -546,28 +787,16 @@ class KeywordScraper:
             sorted_data (list[dict[TerapeakDataKey, Any]]): A list of dictionaries containing sorted product data.
 
         Notes:
+            - Waits for pending image downloads and replaces each `Future` with the downloaded image path.
             - The data is written to both the keyword-specific workbook and the total workbook.
         """
         for data in sorted_data:
-            self.keyword_workbook.write_data_row(self.days_range, data)
-            self.total_workbook.write_data_row(
-                self.days_range, data, self.total_workbook_lock
-            )
+            image_path = data.get(K_IMAGE_PATH)
+            if isinstance(image_path, concurrent.futures.Future):
+                data[K_IMAGE_PATH] = image_path.result()
 
-    def calculate_total_sold(self, datas: list[dict[TerapeakData, Any]]) -> int:
-        """
-        Calculate the total number of items sold from the given data.
-
-        Args:
-            datas (list[dict[TerapeakDataKey, Any]]): A list of dictionaries containing product data.
-
-        Returns:
-            int: The total number of items sold.
-
-        Notes:
-            - Sums up the `TOTAL_SOLD` values from each data dictionary.
-        """
-        return sum(data.get(TerapeakData.TOTAL_SOLD, 0) for data in datas)
+        self.keyword_workbook.write_data_rows(self.days_range, sorted_data)
+        self.total_workbook.write_data_rows(self.days_range, sorted_data)
 
     def write_total_sold(self, total_sold: int) -> None:
         """
@@ -585,71 +814,17 @@ class KeywordScraper:
         self.keyword_workbook.write_total_sold(self.days_range, total_sold)
         return
 
-    def go_to_next_page(self, rows: list[WebElement]) -> bool:
-        """
-        Navigate to the next page if the "Next" button is enabled.
-
-        Args:
-            driver (webdriver.Chrome): The Selenium WebDriver instance.
-            rows (list[WebElement]): List of row elements from the current page.
-
-        Returns:
-            bool: True if the navigation to the next page is successful, False otherwise.
-
-        Notes:
-            - Waits for the current page to become stale before returning.
-            - Logs a message when no more pages are available.
-        """
-        try:
-            if self.driver:
-                next_button = self.driver.find_element(
-                    By.CSS_SELECTOR, "button.pagination__next"
-                )
-                if next_button.is_enabled():
-                    next_button.click()
-                    WebDriverWait(self.driver, 60).until(EC.staleness_of(rows[0]))
-                    return True
-                else:
-                    logging.info("No more pages to scrape.")
-                    return False
-            else:
-                logging.error("Driver is not alive.")
-                return False
-        except Exception as e:
-            logging.error(f"Error while navigating to the next page: {e}")
-            return False
-
-    def next_page_available(self, rows: list[WebElement]) -> bool:
+    def _format_lazy(self, data: dict[TerapeakData, Any]) -> "LazyLogMessage":
         """
-        Navigate to the next page if the "Next" button is enabled.
+        Wrap `format_data_for_logging` so the data is only formatted if the log record is emitted.
 
         Args:
-            driver (webdriver.Chrome): The Selenium WebDriver instance.
-            rows (list[WebElement]): List of row elements from the current page.
+            data (dict[TerapeakData, Any]): The data dictionary to format
 
         Returns:
-            bool: True if the navigation to the next page is successful, False otherwise.
-
-        Notes:
-            - Waits for the current page to become stale before returning.
-            - Logs a message when no more pages are available.
+            LazyLogMessage: An object whose string conversion formats the data.
         """
-        try:
-            if self.driver:
-                next_button = self.driver.find_element(
-                    By.CSS_SELECTOR, "button.pagination__next"
-                )
-                if next_button.is_enabled():
-                    return True
-                else:
-                    logging.info("No more pages to scrape.")
-                    return False
-            else:
-                logging.error("Driver is not alive.")
-                return False
-        except Exception as e:
-            logging.error(f"Error while determining next page availability: {e}")
-            return False
+        return LazyLogMessage(self.format_data_for_logging, data)
 
     def format_data_for_logging(self, data: dict[TerapeakData, Any]) -> str:
         """
@@ -662,12 +837,12 @@ class KeywordScraper:
             str: A formatted string representation of the data
         """
         return (
-            f"\nData for '{self.keyword}' ({self.days_range.value} days):"
-            f"\n  Title: {data.get(TerapeakData.TITLE, 'N/A')}"
-            f"\n  URL: {data.get(TerapeakData.TITLE_HREF, 'N/A')}"
-            f"\n  Avg Sold Price: ${data.get(TerapeakData.AVG_SOLD_PRICE, 0):.2f}"
-            f"\n  Avg Shipping: ${data.get(TerapeakData.AVG_SHIPPING_COST, 0):.2f}"
-            f"\n  Total Sold: {data.get(TerapeakData.TOTAL_SOLD, 0)}"
-            f"\n  Total Sales: ${data.get(TerapeakData.ITEM_SALES, 0):.2f}"
-            f"\n  Last Sold: {data.get(TerapeakData.DATE_LAST_SOLD, 'N/A')}"
+            f"\nData for '{self.keyword}' ({self.days} days):"
+            f"\n  Title: {data.get(K_TITLE, 'N/A')}"
+            f"\n  URL: {data.get(K_TITLE_HREF, 'N/A')}"
+            f"\n  Avg Sold Price: ${data.get(K_AVG_SOLD_PRICE, 0):.2f}"
+            f"\n  Avg Shipping: ${data.get(K_AVG_SHIPPING_COST, 0):.2f}"
+            f"\n  Total Sold: {data.get(K_TOTAL_SOLD, 0)}"
+            f"\n  Total Sales: ${data.get(K_ITEM_SALES, 0):.2f}"
+            f"\n  Last Sold: {data.get(K_DATE_LAST_SOLD, 'N/A')}"
         )
@@ -49,6 +49,6 @@ def scrape(keywords: list[str], output_folder: str) -> None:
         run_time = end_time - start_time
         logging.info("===================================================")
         logging.info("eBay Terapeak scraping has successfully completed.")
-        logging.info(f"Total runtime: {run_time:.6f} seconds")
+        logging.info("Total runtime: %.6f seconds", run_time)
         logging.info("Results saved to: %s", output_folder)
         logging.info("===================================================")
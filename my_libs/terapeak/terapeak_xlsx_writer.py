@@ -1,6 +1,22 @@
+import zipfile
+from collections import OrderedDict
+from enum import IntEnum
+from io import BytesIO
+from operator import itemgetter
+from threading import Lock
+
 import my_libs.utils as Utils
 from my_libs.dependencies import *
 
+try:
+    # Optional: ISA-L's SIMD deflate is a drop-in replacement for zlib, used by zipfile to compress the workbooks
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+if isal_zlib is not None:
+    zipfile.zlib = isal_zlib
+
 
 class TerapeakData(Enum):
     """
@@ -38,7 +54,62 @@ class TerapeakData(Enum):
     IMAGE_PATH = DataAttr(header="Image", column=0)
 
 
-class DaysRange(Enum):
+# Column index of each TerapeakData member, resolved once instead of on every cell write
+TERAPEAK_COLUMNS: dict[TerapeakData, int] = {
+    member: Utils.get_enum_col(member) for member in TerapeakData
+}
+# Header row of the sheets, which only depends on the TerapeakData definition
+TERAPEAK_HEADERS: list[str] = Utils.get_enum_headers_row(TerapeakData)
+# Text cells of a data row, as `Utils.write_row` column specs:
+# (column, data key, url key, check genuine, is date, is currency)
+TERAPEAK_TEXT_CELLS: tuple[
+    tuple[int, TerapeakData, Optional[TerapeakData], bool, bool, bool], ...
+] = (
+    (
+        TERAPEAK_COLUMNS[TerapeakData.KEYWORD],
+        TerapeakData.KEYWORD,
+        None,
+        False,
+        False,
+        False,
+    ),
+    (
+        TERAPEAK_COLUMNS[TerapeakData.TITLE],
+        TerapeakData.TITLE,
+        TerapeakData.TITLE_HREF,
+        True,
+        False,
+        False,
+    ),
+)
+# Data written as one contiguous run of cells with `write_row`, in column order
+TERAPEAK_ROW_VALUES: tuple[TerapeakData, ...] = (
+    TerapeakData.AVG_SOLD_PRICE,
+    TerapeakData.AVG_SHIPPING_COST,
+    TerapeakData.TOTAL_SOLD,
+    TerapeakData.ITEM_SALES,
+    TerapeakData.DATE_LAST_SOLD,
+)
+TERAPEAK_ROW_VALUES_COLUMN = TERAPEAK_COLUMNS[TerapeakData.AVG_SOLD_PRICE]
+# Reads all `TERAPEAK_ROW_VALUES` of a row in one call; `parse_row_data` always sets these keys
+TERAPEAK_ROW_VALUES_GETTER = itemgetter(*TERAPEAK_ROW_VALUES)
+# Number formats of the `TERAPEAK_ROW_VALUES` columns, applied to the whole column so cells need no format
+TERAPEAK_COLUMN_FORMATS: dict[int, FormatType] = {
+    TERAPEAK_COLUMNS[TerapeakData.AVG_SOLD_PRICE]: FormatType.CURRENCY,
+    TERAPEAK_COLUMNS[TerapeakData.AVG_SHIPPING_COST]: FormatType.CURRENCY,
+    TERAPEAK_COLUMNS[TerapeakData.TOTAL_SOLD]: FormatType.NUMBER,
+    TERAPEAK_COLUMNS[TerapeakData.ITEM_SALES]: FormatType.CURRENCY,
+    TERAPEAK_COLUMNS[TerapeakData.DATE_LAST_SOLD]: FormatType.DATE,
+}
+# Upper bound of the image bytes kept in `MyTerapeakExcel.image_cache`
+IMAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Suffix of the file a workbook is written to before it replaces the final file
+TEMP_FILE_SUFFIX = ".tmp"
+# Height of the data rows, which show the embedded product images
+DATA_ROW_HEIGHT = 100
+
+
+class DaysRange(IntEnum):
     """
     Enum class representing the range of days for data analysis.
 
@@ -51,6 +122,8 @@ class DaysRange(Enum):
 
     Notes:
         - Enum members are used to specify the time frame for which data should be analyzed or reported.
+        - As an `IntEnum`, members hash like plain ints, which keeps the per-date-range dict lookups cheap,
+          and their values are the number of days used in the Terapeak URLs.
     """
 
     THIRTY = 30
@@ -62,113 +135,169 @@ class MyTerapeakExcel:
     A class for managing an Excel workbook to store Terapeak data, including data for different date ranges.
 
     This class handles the creation of an Excel workbook, adding and formatting worksheets, and writing data to the sheets.
+    Data rows are buffered per date range; the workbook is only created when it is saved, then its rows are written
+    in order, so no xlsxwriter workbook is kept open while the keywords are being scraped.
 
     Attributes:
-        workbook (xlsxwriter.Workbook): The Excel workbook instance.
+        workbook (xlsxwriter.Workbook): The Excel workbook instance, created when the workbook is saved.
+        output_file (str): The path the workbook is saved to.
         last_30_days_sheet (xlsxwriter.worksheet.Worksheet): Worksheet for storing data from the last 30 days.
         last_90_days_sheet (xlsxwriter.worksheet.Worksheet): Worksheet for storing data from the last 90 days.
+        sheets (dict[DaysRange, xlsxwriter.worksheet.Worksheet]): Worksheet of each date range.
         formats (dict[FormatType, xlsxwriter.format.Format]): Dictionary of formats used in the workbook.
-        row_counts (dict[DaysRange, int]): Dictionary tracking row counts for different date ranges.
+        header_format (xlsxwriter.format.Format): The format of the header row.
+        buffered_rows (dict[DaysRange, list[dict[TerapeakData, Any]]]): Data rows waiting to be written, per date range.
+        total_sold (dict[DaysRange, Optional[int]]): Total number of items sold, per date range.
+        image_cache (OrderedDict[str, bytes]): Bounded cache of image bytes shared by all workbooks, by image path.
 
     Methods:
-        create_workbook(keyword: str, output_directory: str) -> xlsxwriter.Workbook:
-            Creates a new Excel workbook with a filename based on the provided keyword.
-        save_workbook() -> None:
-            Adjusts column widths for all sheets then saves and closes the Excel workbook, handling potential errors.
+        create_workbook() -> xlsxwriter.Workbook:
+            Creates the Excel workbook written to `output_file`.
+        open_workbook() -> None:
+            Creates the workbook with its formats and worksheets and adds the headers.
+        save_workbook() -> Optional[str]:
+            Creates the workbook, writes the buffered rows, adjusts column widths for all sheets then saves and
+            closes the Excel workbook, handling potential errors.
         add_headers() -> None:
             Adds headers to each sheet in the workbook.
-        write_data_row(days_range: DaysRange, data: dict[TerapeakDataKey, Any]) -> None:
-            Writes a row of data to the appropriate worksheet based on the date range.
+        write_data_rows(days_range: DaysRange, rows: list[dict[TerapeakDataKey, Any]]) -> None:
+            Buffers rows of data for the appropriate worksheet based on the date range.
         write_total_sold(days_range: DaysRange, total_sold: int) -> None:
-            Writes the total number of items sold to the appropriate worksheet.
+            Records the total number of items sold for the appropriate worksheet.
     """
 
+    # Image bytes shared by all workbooks, keyed by image path and bounded by `IMAGE_CACHE_MAX_BYTES`
+    image_cache: OrderedDict[str, bytes] = OrderedDict()
+    image_cache_bytes = 0
+    # Workbooks are saved on several threads
+    image_cache_lock = Lock()
+
     def __init__(self, keyword: str, output_dir: str) -> None:
         """
         Initialize an Excel workbook for storing Terapeak data.
 
+        The xlsxwriter workbook itself is created by `open_workbook` when the workbook is saved.
+
         Args:
             keyword (str): The keyword used to name the Excel file.
             output_dir (str): The directory where the workbook will be saved.
 
+        Attributes:
+            output_file (str): The path the workbook is saved to.
+            buffered_rows (dict[DaysRange, list[dict[TerapeakData, Any]]]): Data rows waiting to be written.
+            total_sold (dict[DaysRange, Optional[int]]): Total number of items sold for each day range.
+        """
+        self.output_file = os.path.join(output_dir, f"{keyword}.xlsx")
+        self.buffered_rows: dict[DaysRange, list[dict[TerapeakData, Any]]] = {
+            DaysRange.THIRTY: [],
+            DaysRange.NINETY: [],
+        }
+        self.total_sold: dict[DaysRange, Optional[int]] = {
+            DaysRange.THIRTY: None,
+            DaysRange.NINETY: None,
+        }
+
+    def open_workbook(self) -> None:
+        """
+        Create the workbook with its formats and worksheets, and add the headers.
+
         Attributes:
             workbook (xlsxwriter.Workbook): The Excel workbook instance.
             last_30_days_sheet (xlsxwriter.worksheet.Worksheet): Worksheet for the last 30 days data.
             last_90_days_sheet (xlsxwriter.worksheet.Worksheet): Worksheet for the last 90 days data.
+            sheets (dict[DaysRange, xlsxwriter.worksheet.Worksheet]): Worksheet of each date range.
             formats (dict[FormatType, xlsxwriter.format.Format]): Dictionary of formats used in the workbook.
-            row_counts (dict[DaysRange, int]): Dictionary tracking row counts for different day ranges.
+            header_format (xlsxwriter.format.Format): The format of the header row.
         """
-        self.row_counts: dict[DaysRange, int] = {
-            DaysRange.THIRTY: 0,
-            DaysRange.NINETY: 0,
-        }
-        self.workbook: xlsxwriter.Workbook = self.create_workbook(keyword, output_dir)
+        self.workbook: xlsxwriter.Workbook = self.create_workbook()
         self.formats: dict[FormatType, xlsxwriter.format.Format] = initialize_formats(
             self.workbook
         )
+        self.header_format: xlsxwriter.format.Format = self.formats[FormatType.HEADER]
         self.last_30_days_sheet = self.workbook.add_worksheet("Last 30 days")
         self.last_90_days_sheet = self.workbook.add_worksheet("Last 90 days")
+        self.sheets: dict[DaysRange, xlsxwriter.worksheet.Worksheet] = {
+            DaysRange.THIRTY: self.last_30_days_sheet,
+            DaysRange.NINETY: self.last_90_days_sheet,
+        }
         self.add_headers()
 
-    def create_workbook(
-        self, keyword: str, output_directory: str
-    ) -> xlsxwriter.Workbook:
+    def create_workbook(self) -> xlsxwriter.Workbook:
         """
-        Create a new Excel workbook with a filename based on the provided keyword.
-
-        Args:
-            keyword (str): The keyword used to name the Excel file.
-            output_directory (str): The directory where the workbook will be saved.
+        Create a new Excel workbook for `output_file`.
 
         Returns:
             xlsxwriter.Workbook: The created Workbook instance.
+
+        Notes:
+            - The workbook is written to a temporary file next to `output_file`, which replaces the final file
+              once the workbook is saved.
         """
-        output_file = os.path.join(output_directory, f"{keyword}.xlsx")
-        workbook = xlsxwriter.Workbook(output_file)
-        logging.info(f"Workbook created successfully at {output_file}")
+        output_file = self.output_file + TEMP_FILE_SUFFIX
+        workbook = xlsxwriter.Workbook(
+            output_file,
+            {
+                "strings_to_urls": False,
+                "strings_to_formulas": False,
+            },
+        )
+        logging.info("Workbook created successfully at %s", self.output_file)
         return workbook
 
-    def save_workbook(self) -> None:
+    def save_workbook(self) -> Optional[str]:
         """
-        Adjust column widths for all sheets and save the workbook.
+        Create the workbook, write the buffered rows, adjust column widths for all sheets and save the workbook.
 
-        This method will autofit the columns and set a specific width for the first column of each sheet,
-        then save and close the workbook. This method handles saving the workbook and manages potential
-        errors such as permission issues.
+        This method will create the workbook, write all buffered rows to their worksheets, size the columns to fit their contents and
+        set a specific width for the first column of each sheet, then save and close the workbook. This method
+        handles saving the workbook and manages potential errors such as permission issues.
+
+        Returns:
+            Optional[str]: The path of the saved workbook, or None if the workbook could not be saved.
 
         Notes:
+            - The workbook is only open while it is being saved.
+            - Writes the buffered data rows and total sold counts to their worksheets.
             - Autofits columns in all worksheets.
             - Sets the width for the first column to one-sixth of 100.
-            - Saves and closes the workbook, handling any errors related to file permissions.
+            - Saves and closes the workbook to its temporary file, then moves it to `output_file` with `os.replace`.
+            - If `output_file` is open elsewhere, the workbook is kept at the temporary file instead of waiting for
+              the user, so saving never blocks unattended runs.
             - Logs a message indicating success or an error if the workbook cannot be saved.
-            - Retries if the file is open elsewhere, prompting the user to close it and retry.
         """
+        try:
+            self.open_workbook()
+        except Exception as e:
+            logging.error("An error occurred while creating the workbook: %s", e)
+            return None
+
+        self.write_buffered_rows()
         for sheet in self.workbook.worksheets():
-            # Autofit columns
+            # Autofit columns, keeping their number formats
             sheet.autofit()
             # Set column width for the first column
-            sheet.set_column(0, Utils.get_enum_col(TerapeakData.IMAGE_PATH), 100 / 6)
-        while True:
-            try:
-                self.workbook.close()
-                logging.info("Workbook successfully saved.")
-                break  # Exit the loop if the workbook is saved successfully
-            except OSError as e:
-                if e.errno == errno.EACCES:  # Permission denied error
-                    logging.error(
-                        "PermissionError: Please close the Excel file if it is open and press Enter to retry."
-                    )
-                    input("Please close the Excel file and press Enter to retry...")
-                else:
-                    logging.error(
-                        "An OSError occurred while saving the workbook: %s", e
-                    )
-                    input("An unexpected error occurred. Press Enter to retry...")
-            except Exception as e:
-                logging.error(
-                    "An unexpected error occurred while saving the workbook: %s", e
-                )
-                input("An unexpected error occurred. Press Enter to retry...")
+            sheet.set_column(0, TERAPEAK_COLUMNS[TerapeakData.IMAGE_PATH], 100 / 6)
+
+        temp_file = self.workbook.filename
+        try:
+            self.workbook.close()
+        except Exception as e:
+            logging.error("An error occurred while saving the workbook: %s", e)
+            return None
+
+        try:
+            os.replace(temp_file, self.output_file)
+        except OSError as e:
+            logging.error(
+                "Could not replace %s, it may be open in another program: %s. The workbook was saved to %s instead.",
+                self.output_file,
+                e,
+                temp_file,
+            )
+            return temp_file
+
+        logging.info("Workbook successfully saved to %s", self.output_file)
+        return self.output_file
 
     def add_headers(self) -> None:
         """
@@ -177,30 +306,128 @@ class MyTerapeakExcel:
         This method writes a standard set of headers to all sheets in the workbook,
         formatted according to the predefined header format.
         """
-        headers = Utils.get_enum_headers_row(TerapeakData)
+        header_format = self.header_format
         # Add headers to each sheet
         for sheet in self.workbook.worksheets():
-            sheet.write_row(0, 0, headers, self.formats[FormatType.HEADER])
-        for key in self.row_counts:
-            self.row_counts[key] += 1
+            # Number formats of the data columns
+            for col, format_type in TERAPEAK_COLUMN_FORMATS.items():
+                sheet.set_column(col, col, None, self.formats[format_type])
+            sheet.write_row(0, 0, TERAPEAK_HEADERS, header_format)
 
-    def write_data_row(
+    def write_data_rows(
         self,
         days_range: DaysRange,
-        data: dict[TerapeakData, Any],
-        lock: Optional[Lock] = None,
+        rows: list[dict[TerapeakData, Any]],
     ) -> None:
         """
-        Add data, images, and hyperlinks to a specified row in the Excel sheet for the given date range.
+        Buffer rows of data for the Excel sheet of the given date range.
+
+        The rows are written to the worksheet by `write_buffered_rows` when the workbook is saved, so rows are
+        emitted sequentially in the order they were buffered. The rows are added with a single `list.extend`,
+        which is atomic, so scrapers sharing a workbook need no lock and their rows are never interleaved.
 
         Args:
             days_range (DaysRange): The range of days (e.g., last 30 days or last 90 days) to determine the sheet.
+            rows (list[dict[TerapeakDataKey, Any]]): Dictionaries containing the extracted product data, with keys defined in `TerapeakDataKey`.
+        """
+        self.buffered_rows[days_range].extend(rows)
+
+    def write_total_sold(self, days_range: DaysRange, total_sold: int) -> None:
+        """
+        Record the total number of items sold for the given date range.
+
+        The total is written to the header row of the worksheet when the workbook is saved.
+        """
+        self.total_sold[days_range] = total_sold
+
+    def write_buffered_rows(self) -> None:
+        """
+        Write all buffered data rows and total sold counts to their worksheets.
+
+        Each sheet is written strictly top to bottom: the total sold count completes the header row, then
+        the data rows are appended one after another below it.
+        """
+        write_row_cells = self.write_row_cells
+        for days_range, rows in self.buffered_rows.items():
+            sheet = self.sheets[days_range]
+
+            total_sold = self.total_sold[days_range]
+            if total_sold is not None:
+                sheet.write_string(
+                    0,
+                    8,
+                    f"Total Sold = {total_sold}",
+                    cell_format=self.header_format,
+                )
+
+            for row_index, data in enumerate(rows, start=1):
+                write_row_cells(sheet, row_index, data)
+            rows.clear()
+
+    @classmethod
+    def read_image_data(cls, image_path: str) -> bytes:
+        """
+        Read the bytes of an image file, caching them for the other workbook that embeds the same image.
+
+        Every row is written to both its keyword workbook and the total workbook, so an image is dropped from
+        the cache once it has been read a second time. The cache is also limited to `IMAGE_CACHE_MAX_BYTES`,
+        evicting the least recently read images first, so memory does not grow with the number of keywords;
+        evicted images are read from disk again.
+
+        Args:
+            image_path (str): The path of the image file.
+
+        Returns:
+            bytes: The content of the image file.
+        """
+        with cls.image_cache_lock:
+            image_data = cls.image_cache.pop(image_path, None)
+            if image_data is not None:
+                cls.image_cache_bytes -= len(image_data)
+                return image_data
+
+        with open(image_path, "rb") as image_file:
+            image_data = image_file.read()
+
+        with cls.image_cache_lock:
+            if image_path not in cls.image_cache:
+                cls.image_cache[image_path] = image_data
+                cls.image_cache_bytes += len(image_data)
+            while cls.image_cache_bytes > IMAGE_CACHE_MAX_BYTES:
+                _, evicted_data = cls.image_cache.popitem(last=False)
+                cls.image_cache_bytes -= len(evicted_data)
+        return image_data
+
+    @classmethod
+    def clear_image_cache(cls) -> None:
+        """
+        Release the cached image bytes once all workbooks embedding them have been saved.
+        """
+        with cls.image_cache_lock:
+            cls.image_cache.clear()
+            cls.image_cache_bytes = 0
+
+    def write_row_cells(
+        self,
+        sheet: xlsxwriter.worksheet.Worksheet,
+        row_index: int,
+        data: dict[TerapeakData, Any],
+    ) -> None:
+        """
+        Add data, images, and hyperlinks to a specified row in the Excel sheet.
+
+        Args:
+            sheet (xlsxwriter.worksheet.Worksheet): The worksheet to write to.
+            row_index (int): The index of the row to write.
             data (dict[TerapeakDataKey, Any]): A dictionary containing the extracted product data, with keys defined in `TerapeakDataKey`.
 
         Notes:
             - The row height is set to 100.
             - The method writes product data into specific columns, formats cells, and embeds an image if a path is provided.
+            - Embedded images are read through `read_image_data`, so most image files are read from disk only once.
             - Adds a hyperlink if a valid link is available; otherwise, writes the title as plain text.
+            - The number columns are written with a single `write_row` call and take their number formats from the
+              column formats set in `add_headers`.
             - The following columns are populated:
                 - Column 0: Image (embedded if `IMAGE_PATH` is provided)
                 - Column 1: Keyword
@@ -211,65 +438,24 @@ class MyTerapeakExcel:
                 - Column 6: Item Sales (formatted as currency)
                 - Column 7: Date Last Sold (formatted as date)
         """
-        sheet = (
-            self.last_30_days_sheet
-            if days_range == DaysRange.THIRTY
-            else self.last_90_days_sheet
-        )
-        row_index = self.row_counts[days_range]
-        sheet.set_row(row_index, 100)
+        sheet.set_row(row_index, DATA_ROW_HEIGHT)
 
         # Insert the image if an image path is provided
         image_path = data.get(TerapeakData.IMAGE_PATH)
         if image_path:
-            sheet.embed_image(row_index, 0, image_path)
-
-        fields_to_write = [
-            (TerapeakData.TITLE, TerapeakData.TITLE_HREF),
-            (TerapeakData.KEYWORD, None),
-            (TerapeakData.AVG_SOLD_PRICE, None),
-            (TerapeakData.AVG_SHIPPING_COST, None),
-            (TerapeakData.TOTAL_SOLD, None),
-            (TerapeakData.ITEM_SALES, None),
-            (TerapeakData.DATE_LAST_SOLD, None),
-        ]
-
-        for data_key, url_key in fields_to_write:
-            check_genuine = data_key == TerapeakData.TITLE
-            is_date = data_key == TerapeakData.DATE_LAST_SOLD
-            is_currency = data_key in (
-                TerapeakData.AVG_SHIPPING_COST,
-                TerapeakData.AVG_SOLD_PRICE,
-                TerapeakData.ITEM_SALES,
-            )
-
-            Utils.write_data(
-                sheet,
-                self.formats,
-                row_index,
-                Utils.get_enum_col(data_key),
-                data,
-                data_key,
-                url_key=url_key,
-                check_genuine=check_genuine,
-                is_date=is_date,
-                is_currency=is_currency,
-                lock=lock,
-            )
-
-        self.row_counts[days_range] += 1
+            try:
+                image_data = self.read_image_data(image_path)
+            except OSError as e:
+                logging.warning("Failed to read image %s: %s", image_path, e)
+            else:
+                sheet.embed_image(
+                    row_index, 0, image_path, {"image_data": BytesIO(image_data)}
+                )
 
-    def write_total_sold(self, days_range: DaysRange, total_sold: int) -> None:
-        sheet = (
-            self.last_30_days_sheet
-            if days_range == DaysRange.THIRTY
-            else self.last_90_days_sheet
-        )
-        sheet.write_string(
-            0,
-            8,
-            f"Total Sold = {total_sold}",
-            cell_format=self.formats[FormatType.HEADER],
+        Utils.write_row(sheet, self.formats, row_index, TERAPEAK_TEXT_CELLS, data)
+        # Missing values are written as blank cells; the number formats come from the column formats
+        sheet.write_row(
+            row_index, TERAPEAK_ROW_VALUES_COLUMN, TERAPEAK_ROW_VALUES_GETTER(data)
         )
 
     # def add_screenshot(self, days_range: DaysRange, file_path: str) -> None:
@@ -1,25 +1,102 @@
+import asyncio
+import atexit
+import base64
 import logging
 import os
-from datetime import datetime, timedelta
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from functools import cache
 from enum import Enum
 from io import BytesIO
 from threading import Lock
-from typing import Optional, Type
-from urllib.parse import urlencode, urljoin
+from typing import Optional, Sequence, Type
+from urllib.parse import quote_plus, urlencode, urljoin, urlsplit
 
 import requests
 import xlsxwriter
 import xlsxwriter.format
 import xlsxwriter.worksheet
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from urllib3.util.retry import Retry
 
 from my_libs.xlsxwriter_formats import DataAttr, FormatType
 
+SCREENSHOT_JPEG_QUALITY = 60
+# Base URL for Terapeak research
+TERAPEAK_RESEARCH_URL = "https://www.ebay.com/sh/research"
+# Number of rows Terapeak shows per result page
+TERAPEAK_PAGE_SIZE = 50
+# Image formats recognised from the extension of an image URL
+IMAGE_FORMATS = frozenset(("png", "jpg", "jpeg", "webp", "gif"))
+# Leading bytes of the image formats that can be saved without converting them
+IMAGE_SIGNATURES = {
+    "png": b"\x89PNG\r\n\x1a\n",
+    "jpg": b"\xff\xd8\xff",
+    "jpeg": b"\xff\xd8\xff",
+    "gif": b"GIF8",
+}
+MILLISECONDS_PER_DAY = 86_400_000
+# Day zero of Excel's serial date numbers
+EXCEL_EPOCH = datetime(1899, 12, 30)
+# Timeouts of the image requests: (connect, read) in seconds
+IMAGE_REQUEST_TIMEOUT = (5, 15)
+
+
+class TimeoutSession(requests.Session):
+    """
+    A session that applies a default timeout to requests made without one.
+
+    `requests` does not take timeouts from the session, so without this a request to an unresponsive server
+    would block its worker thread indefinitely.
+    """
+
+    def __init__(self, timeout: tuple[float, float]):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a session whose connection pool keeps the connections to the image servers alive between requests.
+
+    Returns:
+        requests.Session: The session, retrying failed requests with a backoff and timing out stalled ones.
+    """
+    session = TimeoutSession(IMAGE_REQUEST_TIMEOUT)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=2,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(("GET", "HEAD")),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all image downloads, so each download reuses a pooled connection instead of a new handshake
+HTTP_SESSION = create_http_session()
+atexit.register(HTTP_SESSION.close)
+
 
 def get_output_directory(base_folder: str) -> str:
     """
@@ -31,9 +108,6 @@ def get_output_directory(base_folder: str) -> str:
     Returns:
         str: The path to the output directory.
     """
-    if not base_folder.endswith(os.path.sep):
-        base_folder += os.path.sep
-
     today = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     output_directory = os.path.join(base_folder, today)
     os.makedirs(output_directory, exist_ok=True)
@@ -59,11 +133,97 @@ def create_subfolder(parent_folder_path: str, child_folder_name: str) -> str:
 
 
 def delete_folder(folder_path: str) -> None:
-    import shutil
+    """
+    Delete a folder and its contents.
+
+    Folders that only contain files, like the image folder, are emptied with a single `os.scandir` pass;
+    anything else falls back to `shutil.rmtree`.
+
+    Args:
+        folder_path (str): The path of the folder to delete.
+    """
+    if not os.path.exists(folder_path):
+        return
+
+    has_subfolders = False
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                has_subfolders = True
+                break
+            os.unlink(entry.path)
 
-    if os.path.exists(folder_path):
+    if has_subfolders:
         shutil.rmtree(folder_path)
-        logging.info("Deleted image folder: %s", folder_path)
+    else:
+        os.rmdir(folder_path)
+    logging.info("Deleted image folder: %s", folder_path)
+
+
+def get_image_output_path(
+    image_url: str,
+    save_directory: str,
+    image_name: str,
+    content_type: Optional[str] = None,
+) -> tuple[str, str]:
+    """
+    Determine the image format of a URL and the path the image should be saved to.
+
+    Args:
+        image_url (str): The URL of the image.
+        save_directory (str): The directory where the image should be saved.
+        image_name (str): The name to use for the saved image file.
+        content_type (Optional[str]): The Content-Type header of the image response, used when the URL path has
+                                      no known image extension (e.g. a CDN URL with query strings).
+
+    Returns:
+        tuple[str, str]: The image format and the output path.
+    """
+    # Determine the image format from the URL path (lowercase for consistency)
+    image_format = urlsplit(image_url).path.rsplit(".", 1)[-1].lower()
+    if image_format not in IMAGE_FORMATS and content_type:
+        image_format = content_type.split(";", 1)[0].rsplit("/", 1)[-1].strip().lower()
+
+    # Set the output path with the correct extension
+    if image_format == "webp":
+        # Convert WebP images to PNG for compatibility
+        output_path = os.path.join(save_directory, f"{image_name}.png")
+    else:
+        output_path = os.path.join(save_directory, f"{image_name}.{image_format}")
+
+    return image_format, output_path
+
+
+def save_image(content: bytes, image_format: str, output_path: str) -> None:
+    """
+    Decode downloaded image bytes and save them in a format Excel can embed.
+
+    Args:
+        content (bytes): The raw image bytes.
+        image_format (str): The image format determined from the URL.
+        output_path (str): The path to save the image to.
+
+    Notes:
+        - Bytes that already are a PNG, JPEG or GIF matching `image_format` are written as they are, without
+          decoding and re-encoding them with PIL.
+    """
+    signature = IMAGE_SIGNATURES.get(image_format)
+    if signature is not None and content.startswith(signature):
+        with open(output_path, "wb") as file:
+            file.write(content)
+        return
+
+    image = Image.open(BytesIO(content))
+
+    # Convert to RGB if necessary and save
+    if image_format in ("jpg", "jpeg"):
+        if image.mode in ("RGBA", "P"):
+            image = image.convert("RGB")
+        image.save(output_path, "JPEG")
+    else:
+        image.save(
+            output_path, "PNG" if image_format == "webp" else image_format.upper()
+        )
 
 
 def download_image(
@@ -81,32 +241,15 @@ def download_image(
         Optional[str]: The path to the saved image file, or None if an error occurred.
     """
     try:
-        # Determine the image format from the URL (lowercase for consistency)
-        image_format = image_url.split(".")[-1].lower()
-
-        # Set the output path with the correct extension
-        if image_format == "webp":
-            # Convert WebP images to PNG for compatibility
-            output_path = os.path.join(save_directory, f"{image_name}.png")
-        else:
-            output_path = os.path.join(save_directory, f"{image_name}.{image_format}")
-
         logging.debug("Downloading image from %s", image_url)
 
         # Download the image
-        response = requests.get(image_url)
+        response = HTTP_SESSION.get(image_url)
         response.raise_for_status()  # Ensure we notice HTTP errors
-        image = Image.open(BytesIO(response.content))
-
-        # Convert to RGB if necessary and save
-        if image_format in ("jpg", "jpeg"):
-            if image.mode in ("RGBA", "P"):
-                image = image.convert("RGB")
-            image.save(output_path, "JPEG")
-        else:
-            image.save(
-                output_path, "PNG" if image_format == "webp" else image_format.upper()
-            )
+        image_format, output_path = get_image_output_path(
+            image_url, save_directory, image_name, response.headers.get("Content-Type")
+        )
+        save_image(response.content, image_format, output_path)
 
         logging.debug("Image saved successfully as %s", output_path)
         return output_path
@@ -116,8 +259,84 @@ def download_image(
         return None
 
 
+def download_images(
+    jobs: list[tuple[str, str, str]], max_workers: int = 16
+) -> list[Optional[str]]:
+    """
+    Download a batch of images concurrently on a thread pool.
+
+    The threads share the pooled connections of `HTTP_SESSION`, so `max_workers` should not exceed its pool size.
+
+    Args:
+        jobs (list[tuple[str, str, str]]): The (image_url, save_directory, image_name) of each image to download.
+        max_workers (int): The maximum number of concurrent downloads.
+
+    Returns:
+        list[Optional[str]]: The path to each saved image file, or None where an error occurred, in the order of `jobs`.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda job: download_image(*job), jobs))
+
+
+async def download_images_async(
+    jobs: list[tuple[str, str, str]], max_connections: int = 32
+) -> list[Optional[str]]:
+    """
+    Download a batch of images concurrently on a single event loop.
+
+    Requires the optional `httpx[http2]` package. At most `max_connections` downloads are in flight at once, so
+    large batches queue on a semaphore instead of timing out while waiting for a pooled connection. Decoding and
+    writing the images runs on worker threads to keep the event loop free for the downloads.
+
+    Args:
+        jobs (list[tuple[str, str, str]]): The (image_url, save_directory, image_name) of each image to download.
+        max_connections (int): The maximum number of concurrent connections.
+
+    Returns:
+        list[Optional[str]]: The path to each saved image file, or None where an error occurred, in the order of `jobs`.
+    """
+    import httpx
+
+    semaphore = asyncio.Semaphore(max_connections)
+
+    async def _download_image(
+        client: httpx.AsyncClient, image_url: str, save_directory: str, image_name: str
+    ) -> Optional[str]:
+        try:
+            logging.debug("Downloading image from %s", image_url)
+
+            async with semaphore:
+                response = await client.get(image_url)
+            response.raise_for_status()  # Ensure we notice HTTP errors
+            image_format, output_path = get_image_output_path(
+                image_url,
+                save_directory,
+                image_name,
+                response.headers.get("Content-Type"),
+            )
+            await asyncio.to_thread(
+                save_image, response.content, image_format, output_path
+            )
+
+            logging.debug("Image saved successfully as %s", output_path)
+            return output_path
+
+        except Exception as e:
+            logging.error("An error occurred while downloading the image: %s", e)
+            return None
+
+    limits = httpx.Limits(max_connections=max_connections)
+    connect_timeout, read_timeout = IMAGE_REQUEST_TIMEOUT
+    timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+    async with httpx.AsyncClient(http2=True, limits=limits, timeout=timeout) as client:
+        return await asyncio.gather(*(_download_image(client, *job) for job in jobs))
+
+
 def build_terapeak_url(
-    search_keyword: str, day_range: int = 30, offset: Optional[int] = 0
+    search_keyword: str,
+    day_range: int = 30,
+    offset: Optional[int] = 0,
+    limit: int = TERAPEAK_PAGE_SIZE,
 ) -> str:
     """
     Build the eBay URL for the given search keyword.
@@ -125,37 +344,30 @@ def build_terapeak_url(
     Args:
         search_keyword (str): The search keyword.
         day_range (int): The search day range, default is 30.
+        offset (Optional[int]): The number of result rows to skip, default is 0.
+        limit (int): The number of result rows to request, default is a full page.
 
     Returns:
         str: The constructed eBay URL.
     """
-    start_date, end_date = calculate_ebay_dates(day_range)
-
-    # Base URL for Terapeak research
-    base_url = "https://www.ebay.com/sh/research"
-
     if not search_keyword:
         raise ValueError("Keyword must be provided for the search.")
 
-    # Query parameters
-    params = {
-        "marketplace": "EBAY-US",
-        "keywords": search_keyword.replace(" ", "+"),
-        "dayRange": day_range,
-        "endDate": end_date,
-        "startDate": start_date,
-        "conditionId": "1000",
-        "buyerCountry": "BuyerLocation:::US",
-        "offset": offset,
-        "limit": 50,
-        "tabName": "SOLD",
-    }
+    start_date, end_date = calculate_ebay_dates(day_range)
 
-    # Construct the query string
-    query_string = urlencode(params)
-
-    # Construct the full URL using urljoin
-    return urljoin(base_url, f"?{query_string}")
+    # The query parameters always have the same shape, so they are formatted directly instead of with urlencode
+    return (
+        f"{TERAPEAK_RESEARCH_URL}?marketplace=EBAY-US"
+        f"&keywords={quote_plus(search_keyword, safe='')}"
+        f"&dayRange={day_range}"
+        f"&endDate={end_date}"
+        f"&startDate={start_date}"
+        "&conditionId=1000"
+        "&buyerCountry=BuyerLocation%3A%3A%3AUS"
+        f"&offset={offset}"
+        f"&limit={limit}"
+        "&tabName=SOLD"
+    )
 
 
 def build_ebay_search_url(search_keyword: str) -> str:
@@ -176,7 +388,7 @@ def build_ebay_search_url(search_keyword: str) -> str:
 
     # Query parameters
     params = {
-        "_nkw": search_keyword.replace(" ", "+"),
+        "_nkw": search_keyword,
         "_sacat": "0",
         "_ipg": "120",
         "LH_BIN": "1",
@@ -311,6 +523,32 @@ def ebay_clean_product_url(url: Optional[str]) -> Optional[str]:
     return url.split("?")[0]
 
 
+def escape_quotes_many(texts: list[Optional[str]]) -> list[Optional[str]]:
+    """
+    Escapes quotation marks in each of the given texts, like `escape_quotes` over a whole column.
+
+    Args:
+        texts (list[Optional[str]]): The texts in which to escape quotation marks.
+
+    Returns:
+        list[Optional[str]]: The texts with escaped quotation marks, in the same order.
+    """
+    return [None if text is None else text.replace('"', '""') for text in texts]
+
+
+def ebay_clean_product_url_many(urls: list[Optional[str]]) -> list[Optional[str]]:
+    """
+    Trims the query string of each of the given URLs, like `ebay_clean_product_url` over a whole column.
+
+    Args:
+        urls (list[Optional[str]]): The original URLs to be cleaned.
+
+    Returns:
+        list[Optional[str]]: The cleaned URLs, in the same order.
+    """
+    return [None if url is None else url.split("?", 1)[0] for url in urls]
+
+
 def convert_to_excel_date(date: Optional[datetime]) -> Optional[float]:
     """
     Convert a datetime object to an Excel serial date number.
@@ -323,9 +561,7 @@ def convert_to_excel_date(date: Optional[datetime]) -> Optional[float]:
     """
     if date is None:
         return None
-    temp = datetime(1899, 12, 30)  # Excel's epoch
-    delta = date - temp
-    return float(delta.days) + (float(delta.seconds) / 86400)
+    return (date - EXCEL_EPOCH).total_seconds() / 86400.0
 
 
 def calculate_ebay_dates(
@@ -341,15 +577,14 @@ def calculate_ebay_dates(
     Returns:
         tuple[int, int]: A tuple containing the startDate and endDate in milliseconds.
     """
+    # Unix timestamps in milliseconds; the current time needs no datetime conversion
     if end_date is None:
-        end_date = datetime.now()
+        end_timestamp = int(time.time() * 1000)
+    else:
+        end_timestamp = int(end_date.timestamp() * 1000)
 
     # Calculate the start date
-    start_date = end_date - timedelta(days=day_range)
-
-    # Convert to Unix timestamps in milliseconds
-    start_timestamp = int(start_date.timestamp() * 1000)
-    end_timestamp = int(end_date.timestamp() * 1000)
+    start_timestamp = end_timestamp - day_range * MILLISECONDS_PER_DAY
 
     return start_timestamp, end_timestamp
 
@@ -374,6 +609,7 @@ def handle_scraping_exception(e: Exception, search_keyword: str) -> None:
         )
 
 
+@cache
 def get_enum_header(enum_class: Enum) -> str:
     """
     Retrieves the header string from an enum class if it exists.
@@ -387,6 +623,7 @@ def get_enum_header(enum_class: Enum) -> str:
     return header or "Error"
 
 
+@cache
 def get_enum_col(enum_class: Enum) -> int:
     """
     Retrieves the column index from an enum class if it exists.
@@ -399,6 +636,7 @@ def get_enum_col(enum_class: Enum) -> int:
     return enum_class.value.column or 0
 
 
+@cache
 def get_enum_last_col(enum_class) -> int:
     """
     Finds the largest column index across all members of the enum class.
@@ -419,13 +657,76 @@ def get_enum_headers_row(enum_class: Type[Enum]) -> list[str]:
 
     Returns a list of headers in the order of their column indices.
     """
+    return list(_get_enum_headers(enum_class))
+
+
+@cache
+def _get_enum_headers(enum_class: Type[Enum]) -> tuple[str, ...]:
+    """
+    Computes the sorted headers of an enum class once; `get_enum_headers_row` returns copies of them.
+    """
     headers_with_col = [
         (data.value.header, data.value.column)
         for data in enum_class
         if isinstance(data.value, DataAttr)
     ]
     sorted_headers = sorted(headers_with_col, key=lambda x: x[1] or 0)
-    return [header for header, _ in sorted_headers if header is not None]
+    return tuple(header for header, _ in sorted_headers if header is not None)
+
+
+def write_cell(
+    worksheet: xlsxwriter.worksheet.Worksheet,
+    formats: dict[FormatType, xlsxwriter.format.Format],
+    row: int,
+    col: int,
+    data: dict,
+    data_key: Enum,
+    url_key: Optional[Enum] = None,
+    url_string: str = "",
+    check_genuine: bool = False,
+    is_date: bool = False,
+    is_currency: bool = False,
+) -> None:
+    """
+    Writes data to an Excel worksheet cell with appropriate formatting, without lock handling.
+
+    See `write_data` for the formatting rules.
+    """
+    # Extract value and determine format
+    value = data.get(data_key, "")
+    cell_format = None
+
+    if check_genuine and isinstance(value, str) and "genuine" in value.lower():
+        cell_format = formats[FormatType.FILL_URL if url_key else FormatType.FILL]
+
+    # Write a link if the URL key exists and is not None
+    url = data.get(url_key) if url_key is not None else None
+    if url is not None:
+        worksheet.write_url(
+            row,
+            col,
+            url,
+            string=value or url_string,
+            cell_format=cell_format,
+        )
+        return
+
+    # isinstance also writes bools and int/float subclasses (e.g. IntEnum members, numpy scalars) as numbers
+    if isinstance(value, (int, float)):
+        if is_date:
+            cell_format = formats.get(FormatType.DATE)
+        elif is_currency:
+            cell_format = formats.get(FormatType.CURRENCY)
+        elif isinstance(value, float):
+            cell_format = formats.get(FormatType.FLOAT)
+        else:
+            cell_format = formats.get(FormatType.NUMBER)
+
+        worksheet.write_number(row, col, value, cell_format=cell_format)
+    else:
+        worksheet.write_string(
+            row, col, str(value) if value else "", cell_format=cell_format
+        )
 
 
 def write_data(
@@ -450,85 +751,8 @@ def write_data(
 
     If a lock is provided, it will be acquired before writing to ensure thread safety.
     """
-
-    def _write_to_worksheet(
-        worksheet: xlsxwriter.worksheet.Worksheet,
-        formats: dict[FormatType, xlsxwriter.format.Format],
-        row: int,
-        col: int,
-        data: dict,
-        data_key: Enum,
-        url_key: Optional[Enum] = None,
-        url_string: str = "",
-        check_genuine: bool = False,
-        is_date: bool = False,
-        is_currency: bool = False,
-    ):
-        """
-        Private helper function to handle writing data to a worksheet without lock handling.
-        """
-        # Extract value and determine format
-        value = data.get(data_key, "")
-        cell_format = None
-
-        if check_genuine and isinstance(value, str) and "genuine" in value.lower():
-            cell_format = (
-                formats[FormatType.FILL_URL] if url_key else formats[FormatType.FILL]
-            )
-
-        # Determine if URL key exists and is not None
-        has_valid_url_key = url_key is not None and data.get(url_key) is not None
-
-        # Determine cell format based on conditions
-        format_conditions = {
-            "url": has_valid_url_key,
-            "is_date": is_date,
-            "is_currency": is_currency,
-            "is_float": isinstance(value, float),
-            "is_number": isinstance(value, (int, float)),
-        }
-
-        if format_conditions["url"]:
-            worksheet.write_url(
-                row,
-                col,
-                data[url_key],
-                string=value or url_string,
-                cell_format=cell_format,
-            )
-        elif format_conditions["is_number"]:
-            if format_conditions["is_date"]:
-                cell_format = formats.get(FormatType.DATE)
-            elif format_conditions["is_currency"]:
-                cell_format = formats.get(FormatType.CURRENCY)
-            elif format_conditions["is_float"]:
-                cell_format = formats.get(FormatType.FLOAT)
-            else:
-                cell_format = formats.get(FormatType.NUMBER)
-
-            worksheet.write_number(row, col, value, cell_format=cell_format)
-        else:
-            worksheet.write_string(
-                row, col, str(value) if value else "", cell_format=cell_format
-            )
-
-    if lock:
-        with lock:
-            _write_to_worksheet(
-                worksheet,
-                formats,
-                row,
-                col,
-                data,
-                data_key,
-                url_key,
-                url_string,
-                check_genuine,
-                is_date,
-                is_currency,
-            )
-    else:
-        _write_to_worksheet(
+    with lock or nullcontext():
+        write_cell(
             worksheet,
             formats,
             row,
@@ -543,6 +767,36 @@ def write_data(
         )
 
 
+def write_row(
+    worksheet: xlsxwriter.worksheet.Worksheet,
+    formats: dict[FormatType, xlsxwriter.format.Format],
+    row: int,
+    col_specs: Sequence[tuple[int, Enum, Optional[Enum], bool, bool, bool]],
+    data: dict,
+    lock: Optional[Lock] = None,
+) -> None:
+    """
+    Writes several cells of a row to an Excel worksheet with appropriate formatting.
+
+    Each column spec is a (col, data_key, url_key, check_genuine, is_date, is_currency) tuple, formatted
+    as in `write_data`. If a lock is provided, it is acquired once for the whole row instead of once per cell.
+    """
+    with lock or nullcontext():
+        for col, data_key, url_key, check_genuine, is_date, is_currency in col_specs:
+            write_cell(
+                worksheet,
+                formats,
+                row,
+                col,
+                data,
+                data_key,
+                url_key,
+                check_genuine=check_genuine,
+                is_date=is_date,
+                is_currency=is_currency,
+            )
+
+
 def take_screenshot(
     filepath: str, driver: webdriver.Chrome, ss_lock: Optional[Lock] = None
 ) -> bool:
@@ -552,27 +806,35 @@ def take_screenshot(
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
-            original_size = driver.get_window_size()
-            required_width = driver.execute_script(
-                "return document.body.parentNode.scrollWidth"
-            )
-            required_height = driver.execute_script(
-                "return document.body.parentNode.scrollHeight"
+            # Size of the whole page, which is captured beyond the viewport instead of resizing the window
+            metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+            content_size = metrics.get("cssContentSize") or metrics["contentSize"]
+            # Capture a JPEG through CDP; much smaller to transfer and encode than a PNG
+            screenshot = driver.execute_cdp_cmd(
+                "Page.captureScreenshot",
+                {
+                    "format": "jpeg",
+                    "quality": SCREENSHOT_JPEG_QUALITY,
+                    "captureBeyondViewport": True,
+                    "clip": {
+                        "x": 0,
+                        "y": 0,
+                        "width": content_size["width"],
+                        "height": content_size["height"],
+                        "scale": 1,
+                    },
+                },
             )
-            driver.set_window_size(required_width, required_height)
-            ss_success = driver.find_element(By.TAG_NAME, "body").screenshot(
-                filepath
-            )  # avoids scrollbar
-            driver.set_window_size(original_size["width"], original_size["height"])
-            if ss_success:
-                logging.info(f"Screenshot saved at {filepath}")
-                return True
-            else:
-                logging.error("Failed to save screenshot.")
-                return False
+            with open(filepath, "wb") as file:
+                file.write(base64.b64decode(screenshot["data"]))
+            logging.info("Screenshot saved at %s", filepath)
+            return True
         except TimeoutException:
             logging.error("Timed out waiting for body element to be present")
             return False
+        except Exception as e:
+            logging.error("Failed to save screenshot: %s", e)
+            return False
 
     if ss_lock:
         with ss_lock:
@@ -581,14 +843,45 @@ def take_screenshot(
         return _take_screenshot(filepath, driver)
 
 
+def read_image_bytes(file_path: str) -> bytes:
+    """
+    Read an image file.
+
+    The file is always read from disk, since screenshots are overwritten at the same path.
+
+    Args:
+        file_path (str): The path of the image file.
+
+    Returns:
+        bytes: The content of the image file.
+    """
+    with open(file_path, "rb") as file:
+        return file.read()
+
+
 def add_screenshot_to_sheet(
-    sheet: xlsxwriter.worksheet.Worksheet, row: int, file_path: str
+    sheet: xlsxwriter.worksheet.Worksheet,
+    row: int,
+    file_path: str,
+    image_data: Optional[bytes] = None,
 ) -> None:
+    """
+    Insert a screenshot into the first column of a worksheet row.
+
+    Args:
+        sheet (xlsxwriter.worksheet.Worksheet): The worksheet to insert the screenshot into.
+        row (int): The row to insert the screenshot at.
+        file_path (str): The path of the screenshot file, also used as the image name in the workbook.
+        image_data (Optional[bytes]): The screenshot bytes if they are already in memory; otherwise the file
+                                      is read through a small cache of recently used images.
+    """
     try:
+        if image_data is None:
+            image_data = read_image_bytes(file_path)
         # Attempt to insert the image into the specified sheet and row
-        sheet.insert_image(row, 0, file_path)
-        logging.info(f"Inserted screenshot from {file_path} at row {row}")
+        sheet.insert_image(row, 0, file_path, {"image_data": BytesIO(image_data)})
+        logging.info("Inserted screenshot from %s at row %d", file_path, row)
     except FileNotFoundError:
-        logging.error(f"File not found: {file_path}")
+        logging.error("File not found: %s", file_path)
     except Exception as e:
-        logging.error(f"Error inserting image at row {row}: {e}")
+        logging.error("Error inserting image at row %d: %s", row, e)
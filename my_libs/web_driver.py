@@ -1,44 +1,230 @@
+import hashlib
 import json
 import logging
 import os
+import random
+import re
+import threading
 import time
-from queue import Queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
+from typing import Optional
 
 from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException,
+    TimeoutException,
     WebDriverException,
 )
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    # Optional: orjson reads and writes the cookie files faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
 os.environ["WDM_LOG"] = str(logging.NOTSET)
 cookie_update_lock = Lock()
 
+# Domain of the saved cookies that are applied to the eBay session
+EBAY_COOKIE_DOMAIN = ".ebay.com"
+
+# eBay pages that interrupt scraping, matched against the current URL in a single search.
+# The name of the matching group tells which page is open.
+EBAY_URL_STATES = re.compile(
+    r"(?P<captcha>www\.ebay\.com/splashui/captcha|signin\.ebay\.com)"
+    r"|(?P<passkey>accounts\.ebay\.com/acctsec/authn-register)"
+    r"|(?P<limit_exceeded>^https://pages\.ebay\.com/limitexceeded\.html$)"
+)
+
+# Chrome flags that turn off browser features the scraper never uses
+CHROME_PERFORMANCE_ARGUMENTS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=TranslateUI",
+)
+# Content settings of the headless drivers: images are not loaded, since only their URLs are read
+HEADLESS_CHROME_PREFS = {"profile.managed_default_content_settings.images": 2}
+
+# Exponential backoff between CAPTCHA checks and bypass attempts: first delay and cap, in seconds
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+# Number of failed cookies listed in the summary log record of `load_ebay_cookies`
+MAX_LOGGED_COOKIE_FAILURES = 5
+
+# Hash of the cookies last written by `save_cookies`, used to skip rewriting unchanged cookies
+_last_cookies_hash: Optional[bytes] = None
+
+# ChromeDriver binary resolved by `get_chromedriver_path`, shared by all drivers of the run
+_chromedriver_path: Optional[str] = None
+_chromedriver_path_lock = Lock()
+
+# How long a single wait for the manual login lasts before it is logged and restarted, in seconds
+LOGIN_WAIT_TIMEOUT = 600
+# How often the login page is checked while waiting for the manual login, in seconds
+LOGIN_POLL_FREQUENCY = 0.5
+
+# Size of the keep-alive connection pool used for WebDriver commands (urllib3 defaults to 1)
+COMMAND_POOL_MAXSIZE = 16
+
+_original_get_connection_manager = RemoteConnection._get_connection_manager
+
+
+def _get_pooled_connection_manager(self: RemoteConnection):
+    """
+    Build Selenium's connection manager with a larger per-host pool so concurrent
+    commands reuse keep-alive sockets instead of discarding connections.
+    """
+    connection_manager = _original_get_connection_manager(self)
+    connection_manager.connection_pool_kw["maxsize"] = COMMAND_POOL_MAXSIZE
+    return connection_manager
+
+
+RemoteConnection._get_connection_manager = _get_pooled_connection_manager
+
 
 class DriverPool:
+    """
+    A pool of Chrome WebDrivers shared by the scraper threads.
+
+    Each thread is pinned to the driver it first acquires and keeps reusing it, with its eBay session,
+    for all of its tasks. Drivers are only quit in `cleanup`.
+
+    Idle drivers are kept in a deque, whose `append` and `popleft` are atomic, and a semaphore counts them,
+    so acquiring a driver takes no lock besides the semaphore's.
+    """
+
     def __init__(self, max_workers: int) -> None:
-        logging.info(f"Initializing driver pool with {max_workers} drivers...")
-        self.pool = Queue(max_workers)
-        for _ in range(max_workers):
-            driver = initialize_driver()
-            self.pool.put(driver)
+        logging.info("Initializing driver pool with %d drivers...", max_workers)
+        self.pool: deque[webdriver.Chrome] = deque()
+        self.available = threading.Semaphore(0)
+        self.drivers: list[webdriver.Chrome] = []
+        self.thread_local = threading.local()
+        # Resolve the ChromeDriver binary once before the drivers are launched in parallel
+        get_chromedriver_path()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(initialize_driver) for _ in range(max_workers)]
+        errors = []
+        for future in futures:
+            try:
+                self.drivers.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            # Quit the drivers that did start instead of leaving their browsers open
+            self.cleanup()
+            raise errors[0]
+        for driver in self.drivers:
+            self.pool.append(driver)
+            self.available.release()
+
+    def __len__(self) -> int:
+        """Return the number of drivers not yet pinned to a thread."""
+        return len(self.pool)
 
     def acquire(self) -> webdriver.Chrome:
-        return self.pool.get()
+        driver = getattr(self.thread_local, "driver", None)
+        if driver is None:
+            self.available.acquire()
+            driver = self.pool.popleft()
+            self.thread_local.driver = driver
+        return driver
 
     def release(self, driver) -> None:
-        self.pool.put(driver)
+        # The driver stays pinned to the current thread for its next task
+        pass
 
     def cleanup(self) -> None:
-        while not self.pool.empty():
-            driver = self.pool.get()
-            close_driver(driver)
+        while self.drivers:
+            close_driver(self.drivers.pop())
+
+
+def get_chromedriver_path() -> str:
+    """
+    Install the ChromeDriver binary matching the installed Chrome, or find it in the cache.
+
+    The path is memoized, so `webdriver_manager` only checks its cache and the network once per run, even
+    when several threads start drivers at the same time (e.g. login drivers during CAPTCHA retries).
+
+    Returns:
+        str: The path to the ChromeDriver executable.
+    """
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        with _chromedriver_path_lock:
+            if _chromedriver_path is None:
+                _chromedriver_path = ChromeDriverManager().install()
+    return _chromedriver_path
+
+
+class LoginDriverSingleton:
+    """
+    The visible Chrome WebDriver used for manual logins, shared by all threads.
+
+    At most one login browser is open at a time. It is started by the first login and kept open between
+    logins, which saves launching a new Chrome for every cookie refresh. Threads that need to log in while
+    another thread's login is in progress wait on `cookie_update_lock`, then reuse the refreshed cookies.
+    """
+
+    _driver: Optional[webdriver.Chrome] = None
+    _lock = Lock()
+
+    @classmethod
+    def get(cls) -> webdriver.Chrome:
+        """
+        Return the login driver, starting a new one if there is none or its browser was closed.
+
+        Returns:
+            webdriver.Chrome: The visible Chrome WebDriver instance.
+        """
+        with cls._lock:
+            if cls._driver is not None:
+                try:
+                    cls._driver.current_url
+                except WebDriverException:
+                    logging.debug("Login browser was closed; starting a new one.")
+                    close_driver(cls._driver)
+                    cls._driver = None
+            if cls._driver is None:
+                cls._driver = initialize_driver(headless=False)
+            return cls._driver
+
+    @classmethod
+    def release(cls, driver: webdriver.Chrome) -> None:
+        """
+        Clear the session of the login driver and keep it open for the next login.
+
+        Args:
+            driver (webdriver.Chrome): The login driver, which replaces the stored one if the browser was
+                                       reopened during the login.
+        """
+        with cls._lock:
+            cls._driver = driver
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except WebDriverException:
+                # The browser was closed; `get` starts a new one
+                pass
+
+    @classmethod
+    def close(cls) -> None:
+        """Quit the login driver if it is open."""
+        with cls._lock:
+            if cls._driver is not None:
+                close_driver(cls._driver)
+                cls._driver = None
 
 
 def initialize_driver(headless: bool = True) -> webdriver.Chrome:
@@ -64,16 +250,25 @@ def initialize_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument("--log-level=3")
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--incognito")
+    # Return from navigations once the DOM is ready instead of waiting for all subresources;
+    # pages are read through explicit waits for the elements they need
+    chrome_options.page_load_strategy = "eager"
+    for argument in CHROME_PERFORMANCE_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    if headless:
+        # The visible login driver keeps loading images for the user, e.g. for the reCAPTCHA
+        chrome_options.add_experimental_option("prefs", HEADLESS_CHROME_PREFS)
     try:
         driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
+            service=ChromeService(executable_path=get_chromedriver_path()),
             options=chrome_options,
         )
         logging.info(
-            f"Chrome WebDriver initialized successfully with headless mode set to {headless}."
+            "Chrome WebDriver initialized successfully with headless mode set to %s.",
+            headless,
         )
     except Exception as e:
-        logging.error(f"Failed to initialize driver: {e}", exc_info=True)
+        logging.error("Failed to initialize driver: %s", e, exc_info=True)
         raise
 
     return driver
@@ -85,7 +280,7 @@ def close_driver(driver: webdriver.Chrome) -> None:
         driver.quit()
         logging.info("WebDriver closed.")
     except Exception as e:
-        logging.error(f"Error raised when closing WebDriver: {e}")
+        logging.error("Error raised when closing WebDriver: %s", e)
 
 
 def handle_ebay_session(
@@ -117,7 +312,7 @@ def handle_ebay_session(
 
     logging.warning("Cookies invalid or missing, attempting to obtain new cookies")
     for attempt in range(1, max_retries + 1):
-        logging.info(f"Attempt to handle cookies... ({attempt} / {max_retries})")
+        logging.info("Attempt to handle cookies... (%d / %d)", attempt, max_retries)
 
         with cookie_update_lock:
             logging.debug("Acquired cookie_update_lock for cookie management.")
@@ -130,20 +325,20 @@ def handle_ebay_session(
                 )
                 return True
 
-            # Attempt to initialize a visible driver for user login if cookies are still invalid
-            logging.debug(
-                "Initializing a visible login driver for user authentication."
-            )
+            # Attempt to get the visible driver for user login if cookies are still invalid
+            logging.debug("Getting the visible login driver for user authentication.")
             try:
-                login_driver = initialize_driver(headless=False)
-                logging.debug("Visible login driver initialized successfully.")
+                login_driver = LoginDriverSingleton.get()
             except Exception as e:
                 logging.error("Error initializing visible login driver: %s", str(e))
                 continue
 
             try:
                 logging.debug("Prompting user for login credentials.")
-                if ebay_prompt_user_login(login_driver, cookies_file):
+                logged_in, login_driver = ebay_prompt_user_login(
+                    login_driver, cookies_file
+                )
+                if logged_in:
                     logging.debug(
                         "User login successful; applying cookies to the main driver."
                     )
@@ -156,8 +351,8 @@ def handle_ebay_session(
                     logging.error("Login failed; unable to save cookies. Retrying...")
 
             finally:
-                # Ensure the login driver is closed properly
-                close_driver(login_driver)
+                # Keep the login driver open for the next login, without this session
+                LoginDriverSingleton.release(login_driver)
 
     logging.error("Max retries reached. Cookie handling failed.")
     return False
@@ -182,9 +377,10 @@ def ebay_load_and_apply_cookies(driver: webdriver.Chrome, cookies_file: str) ->
         logging.debug("Refreshing page to apply cookies")
         driver.refresh()  # Refresh to apply cookies
 
-        logging.debug("Waiting for page body to load")
+        logging.debug("Waiting for page to load")
         WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
+            lambda driver: driver.execute_script("return document.readyState")
+            in ("interactive", "complete")
         )
         logging.info("Cookies loaded successfully and the page has been refreshed.")
         return True
@@ -193,7 +389,9 @@ def ebay_load_and_apply_cookies(driver: webdriver.Chrome, cookies_file: str) ->
         return False
 
 
-def ebay_prompt_user_login(login_driver: webdriver.Chrome, cookies_file: str) -> bool:
+def ebay_prompt_user_login(
+    login_driver: webdriver.Chrome, cookies_file: str
+) -> tuple[bool, webdriver.Chrome]:
     """
     Prompts the user to log in manually and saves the new cookies.
 
@@ -202,7 +400,8 @@ def ebay_prompt_user_login(login_driver: webdriver.Chrome, cookies_file: str) ->
         cookies_file (str): The path to the cookies file.
 
     Returns:
-        bool: True if login and saving cookies were successful, False otherwise.
+        tuple[bool, webdriver.Chrome]: True if login and saving cookies were successful, False otherwise, and
+                                       the login driver, which is replaced if the user closed the browser.
     """
 
     def read_credentials(credentials_file: str) -> tuple:
@@ -218,26 +417,29 @@ def ebay_prompt_user_login(login_driver: webdriver.Chrome, cookies_file: str) ->
         email = None
         password = None
 
-        if os.path.exists(credentials_file):
-            try:
-                with open(credentials_file, "r") as file:
-                    lines = file.readlines()
-
-                    for line in lines:
-                        if line.startswith("Email:"):
-                            email = line.split("Email:")[1].strip()
-                        elif line.startswith("Password:"):
-                            password = line.split("Password:")[1].strip()
-
-                    # Logging for feedback
-                    if email or password:
-                        logging.info("Credentials loaded successfully.")
-                    else:
-                        logging.warning("Credentials file is empty.")
-            except Exception as e:
-                logging.error(f"Error reading credentials file: {e}")
-        else:
-            logging.warning(f"Credentials file '{credentials_file}' not found.")
+        try:
+            with open(credentials_file, "r") as file:
+                data = file.read()
+
+            # Parse the "Key: value" lines in a single pass
+            credentials = {
+                key.strip(): value.strip()
+                for key, value in (
+                    line.split(":", 1) for line in data.splitlines() if ":" in line
+                )
+            }
+            email = credentials.get("Email")
+            password = credentials.get("Password")
+
+            # Logging for feedback
+            if email or password:
+                logging.info("Credentials loaded successfully.")
+            else:
+                logging.warning("Credentials file is empty.")
+        except FileNotFoundError:
+            logging.warning("Credentials file '%s' not found.", credentials_file)
+        except Exception as e:
+            logging.error("Error reading credentials file: %s", e)
 
         return email, password
 
@@ -245,7 +447,11 @@ def ebay_prompt_user_login(login_driver: webdriver.Chrome, cookies_file: str) ->
         "Cookies are invalid or missing. User will need to log in manually."
     )
     login_url = "https://www.ebay.com/signin/"
-    login_driver.get(login_url)
+    try:
+        login_driver.get(login_url)
+    except WebDriverException:
+        # The browser was closed; `monitor_browser` reopens it on the login page
+        pass
 
     # email, password = read_credentials("eBayLogin.txt")
     # Monitor the browser window during the login process
@@ -254,9 +460,9 @@ def ebay_prompt_user_login(login_driver: webdriver.Chrome, cookies_file: str) ->
     # Save new cookies after user login
     try:
         save_cookies(login_driver, cookies_file)
-        return True
+        return True, login_driver
     except Exception:
-        return False
+        return False, login_driver
 
 
 def ebay_wait_for_user_login(driver: webdriver.Chrome) -> None:
@@ -272,20 +478,21 @@ def ebay_wait_for_user_login(driver: webdriver.Chrome) -> None:
     logging.warning(
         "Please complete the login process manually, including solving the reCAPTCHA if required."
     )
+
+    def is_logged_in(driver: webdriver.Chrome) -> bool:
+        # Check if the logged-in user element has the 'gh-control' class
+        logged_in_element = driver.find_element(By.ID, "gh-ug")
+        return "gh-control" in (logged_in_element.get_attribute("class") or "")
+
+    # The wait retries on its own while the logged-in user element is missing
+    wait = WebDriverWait(driver, LOGIN_WAIT_TIMEOUT, poll_frequency=LOGIN_POLL_FREQUENCY)
     while True:
         try:
-            # Check for the logged-in user element
-            logged_in_element = driver.find_element(By.ID, "gh-ug")
-            logged_in_element_classes = logged_in_element.get_attribute("class")
-            # Check if the element has the 'gh-control' class
-            if logged_in_element_classes and "gh-control" in logged_in_element_classes:
-                logging.info("User login detected, proceeding with the session.")
-                break
-            else:
-                logging.debug("User is not logged in yet.")
-        except Exception:
+            wait.until(is_logged_in)
+            logging.info("User login detected, proceeding with the session.")
+            break
+        except TimeoutException:
             logging.debug("Waiting for user login to complete...")
-            time.sleep(5)  # Check every 5 seconds
 
 
 def save_cookies(driver: webdriver.Chrome, filename: str) -> None:
@@ -295,13 +502,56 @@ def save_cookies(driver: webdriver.Chrome, filename: str) -> None:
     Args:
         driver (WebDriver): The Chrome WebDriver instance to use.
         filename (str): The path to the file where cookies will be saved.
+
+    Notes:
+        - The file is not rewritten if the cookies are the same as the ones saved last.
+        - The cookies are written to a temporary file first, so a failed write never leaves a truncated file.
     """
-    with open(filename, "w") as file:
-        cookies = driver.get_cookies()
-        json.dump(cookies, file)
+    global _last_cookies_hash
+    cookies = driver.get_cookies()
+    if orjson is not None:
+        data = orjson.dumps(cookies)
+    else:
+        data = json.dumps(cookies).encode("utf-8")
+
+    cookies_hash = hashlib.blake2b(data, digest_size=16).digest()
+    if cookies_hash == _last_cookies_hash and os.path.exists(filename):
+        logging.info("Cookies unchanged; '%s' is up to date.", filename)
+        return
+
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, "wb") as file:
+        file.write(data)
+    os.replace(temp_filename, filename)
+    _last_cookies_hash = cookies_hash
     logging.info("Cookies successfully saved to '%s'.", filename)
 
 
+def to_cdp_cookie(cookie: dict) -> dict:
+    """
+    Convert a cookie returned by Selenium's `get_cookies` to a CDP `Network.CookieParam`.
+
+    Args:
+        cookie (dict): The Selenium cookie.
+
+    Returns:
+        dict: The cookie parameters for `Network.setCookies`.
+    """
+    cdp_cookie = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain", EBAY_COOKIE_DOMAIN),
+        "path": cookie.get("path", "/"),
+    }
+    for key in ("secure", "httpOnly", "sameSite"):
+        if key in cookie:
+            cdp_cookie[key] = cookie[key]
+    # Cookies without an expiry are session cookies
+    if "expiry" in cookie:
+        cdp_cookie["expires"] = cookie["expiry"]
+    return cdp_cookie
+
+
 def load_ebay_cookies(driver: webdriver.Chrome, filename: str) -> None:
     """
     Loads cookies from a file and adds them to the WebDriver session.
@@ -314,26 +564,51 @@ def load_ebay_cookies(driver: webdriver.Chrome, filename: str) -> None:
         FileNotFoundError: If the specified cookie file does not exist.
         RuntimeError: If there is an issue loading cookies from the file or adding them to the driver.
     """
-    if not os.path.isfile(filename):
-        message = f"File '{filename}' does not exist."
-        raise FileNotFoundError(message)
-
     try:
-        with open(filename, "r") as file:
-            cookies = json.load(file)
+        with open(filename, "rb") as file:
+            data = file.read()
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        cookies = orjson.loads(data) if orjson is not None else json.loads(data)
+
+        # Only cookies of the eBay domain can be added while the eBay home page is open
+        ebay_cookies = [
+            cookie
+            for cookie in cookies
+            if cookie.get("domain", EBAY_COOKIE_DOMAIN) == EBAY_COOKIE_DOMAIN
+        ]
+        if len(ebay_cookies) != len(cookies):
+            logging.debug(
+                "Skipping %d cookies of other domains.", len(cookies) - len(ebay_cookies)
+            )
 
         driver.get("https://www.ebay.com")
-        for cookie in cookies:
-            try:
-                if "domain" in cookie and cookie["domain"] != ".ebay.com":
-                    logging.debug("Skipping cookie with domain '%s'.", cookie["domain"])
-                    continue
-                driver.add_cookie(cookie)
-            except Exception as e:
-                logging.warning("Error adding cookie '%s': %s", cookie, e)
+        try:
+            # Add all cookies with a single DevTools command instead of one command per cookie
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [to_cdp_cookie(cookie) for cookie in ebay_cookies]},
+            )
+        except Exception as e:
+            logging.debug("Adding cookies with CDP failed, adding them one by one: %s", e)
+            failed_cookies = []
+            for cookie in ebay_cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    failed_cookies.append((cookie.get("name"), str(e)))
+            if failed_cookies:
+                # A summary with the first few failures, instead of one record per cookie
+                logging.warning(
+                    "Error adding %d cookies: %s",
+                    len(failed_cookies),
+                    failed_cookies[:MAX_LOGGED_COOKIE_FAILURES],
+                )
 
         logging.info("Cookies loaded and added to WebDriver session.")
 
+    except FileNotFoundError:
+        message = f"File '{filename}' does not exist."
+        raise FileNotFoundError(message) from None
     except json.JSONDecodeError as e:
         message = f"Error decoding cookies from file '{filename}': {e}"
         raise RuntimeError(message)
@@ -363,8 +638,6 @@ def monitor_browser(
     """
     while True:
         try:
-            # Check if browser is still open by accessing the current URL
-            login_driver.current_url
             # if email:
             #     try:
             #         email_input = current_driver.find_element(By.ID, "userid")
@@ -385,20 +658,20 @@ def monitor_browser(
             #             logging.info("Password field filled.")
             #     except NoSuchElementException:
             #         pass
+
+            # Check if user has completed login (customize this check as needed). Reading the current URL
+            # also fails if the browser was closed.
+            WebDriverWait(
+                login_driver, LOGIN_WAIT_TIMEOUT, poll_frequency=LOGIN_POLL_FREQUENCY
+            ).until(lambda driver: "signin" not in driver.current_url)
+            break
+        except TimeoutException:
+            logging.info("Waiting for user to sign in...")
         except WebDriverException:
             logging.error("Browser was closed accidentally. Reinitializing...")
             close_driver(login_driver)
             login_driver = initialize_driver(headless=False)
             login_driver.get(destination)
-            continue
-
-        # Check if user has completed login (customize this check as needed)
-        if "signin" not in login_driver.current_url:
-            break
-        else:
-            logging.info("Waiting for user to sign in...")
-
-        time.sleep(5)  # Wait before checking again
 
     return login_driver
 
@@ -415,13 +688,27 @@ def reload_ebay_cookies(
     """
     logging.debug("Deleting all cookies")
     driver.delete_all_cookies()
-    logging.debug(f"Handling cookies with use_fresh_session={use_fresh_session}")
+    logging.debug("Handling cookies with use_fresh_session=%s", use_fresh_session)
     if not handle_ebay_session(driver, use_fresh_session):
         raise Exception("Failed to handle cookies.")
-    logging.debug(f"Navigating to destination: {destination}")
+    logging.debug("Navigating to destination: %s", destination)
     driver.get(destination)  # Navigate to the destination
 
 
+def sleep_with_backoff(delay: float) -> float:
+    """
+    Sleep for the given delay plus a random jitter of up to half of it.
+
+    Args:
+        delay (float): The delay to sleep for, in seconds.
+
+    Returns:
+        float: The doubled delay for the next retry, capped at `RETRY_MAX_DELAY`.
+    """
+    time.sleep(delay + random.uniform(0, 0.5 * delay))
+    return min(delay * 2, RETRY_MAX_DELAY)
+
+
 def attempt_captcha_bypass(driver: webdriver.Chrome, destination: str) -> bool:
     """
     Attempts to bypass CAPTCHA by reloading cookies multiple times.
@@ -435,10 +722,13 @@ def attempt_captcha_bypass(driver: webdriver.Chrome, destination: str) -> bool:
     """
     max_attempts: int = 5
     attempts: int = 0
+    delay = RETRY_BASE_DELAY
 
     while attempts < max_attempts:
         logging.warning(
-            f"CAPTCHA or Login detected. Attempting to bypass by reloading cookies... ({attempts+1} / {max_attempts})"
+            "CAPTCHA or Login detected. Attempting to bypass by reloading cookies... (%d / %d)",
+            attempts + 1,
+            max_attempts,
         )
         reload_ebay_cookies(driver, destination)
         attempts += 1
@@ -447,6 +737,9 @@ def attempt_captcha_bypass(driver: webdriver.Chrome, destination: str) -> bool:
             logging.info("CAPTCHA Bypassed successfully.")
             return True
 
+        if attempts < max_attempts:
+            delay = sleep_with_backoff(delay)
+
     logging.warning("CAPTCHA Bypass failed after maximum attempts.")
     return False
 
@@ -460,16 +753,18 @@ def check_ebay_captcha(driver: webdriver.Chrome, destination: str) -> None:
         destination: The URL to load after CAPTCHA or login is handled.
     """
     attemped_bypass = False
+    delay = RETRY_BASE_DELAY
 
     logging.debug("Starting CAPTCHA/login check loop")
     while True:
-        logging.debug(f"Current URL: {driver.current_url}")
+        # Each read of `current_url` is a round trip to chromedriver, so read it once per check
+        url = driver.current_url
+        logging.debug("Current URL: %s", url)
+        match = EBAY_URL_STATES.search(url)
+        url_state = match.lastgroup if match else None
 
         # Handle CAPTCHA/Login pages
-        if (
-            "www.ebay.com/splashui/captcha" in driver.current_url
-            or "signin.ebay.com" in driver.current_url
-        ):
+        if url_state == "captcha":
 
             if not attemped_bypass:
                 attemped_bypass = True
@@ -485,7 +780,7 @@ def check_ebay_captcha(driver: webdriver.Chrome, destination: str) -> None:
             continue
 
         # Handle passkey registration
-        elif "accounts.ebay.com/acctsec/authn-register" in driver.current_url:
+        elif url_state == "passkey":
             logging.debug("Passkey registration page detected")
             try:
                 skip_button = driver.find_element(By.ID, "passkeys-cancel-btn")
@@ -499,7 +794,7 @@ def check_ebay_captcha(driver: webdriver.Chrome, destination: str) -> None:
                 )
 
         # Handle limit exceeded
-        elif driver.current_url == "https://pages.ebay.com/limitexceeded.html":
+        elif url_state == "limit_exceeded":
             logging.error("Limit exceeded page detected. Stopping scraper.")
             raise Exception("LimitExceededException")
 
@@ -508,8 +803,8 @@ def check_ebay_captcha(driver: webdriver.Chrome, destination: str) -> None:
             logging.debug("No CAPTCHA/login/passkey/limit issues detected")
             break
 
-        logging.debug("Waiting 5 seconds before next check")
-        time.sleep(5)
+        logging.debug("Waiting about %.1f seconds before next check", delay)
+        delay = sleep_with_backoff(delay)
 
 
 def verify_cookies_bypass_captcha(driver: webdriver.Chrome) -> bool:
@@ -522,10 +817,8 @@ def verify_cookies_bypass_captcha(driver: webdriver.Chrome) -> bool:
     Returns:
         bool: True if no CAPTCHA/login page is detected, False otherwise.
     """
-    return not (
-        "www.ebay.com/splashui/captcha" in driver.current_url
-        or "signin.ebay.com" in driver.current_url
-    )
+    match = EBAY_URL_STATES.search(driver.current_url)
+    return not (match and match.lastgroup == "captcha")
 
 
 def save_html(driver: webdriver.Chrome, filename: str) -> None:
@@ -1,18 +1,20 @@
-from enum import Enum, auto
+from dataclasses import dataclass
+from enum import IntEnum, auto
 from typing import Optional
+from weakref import WeakKeyDictionary
 
 import xlsxwriter
 import xlsxwriter.format
-from attr import dataclass
 
 
-@dataclass
-class DataAttr():
+# Compared by identity: members of an Enum whose DataAttr values are equal would otherwise become aliases
+@dataclass(slots=True, frozen=True, eq=False)
+class DataAttr:
     header: Optional[str] = None
     column: Optional[int] = None
 
 
-class FormatType(Enum):
+class FormatType(IntEnum):
     """
     Enum class representing the different types of formatting options for data in Excel sheets.
 
@@ -27,6 +29,7 @@ class FormatType(Enum):
 
     Notes:
         - Enum members can be used to apply appropriate formatting styles when generating Excel reports or outputs.
+        - Members are ints, so looking up their formats in the formats dictionary uses the fast int hash.
     """
 
     HEADER = auto()
@@ -38,6 +41,12 @@ class FormatType(Enum):
     FILL_URL = auto()
 
 
+# Formats already added to each workbook, released along with the workbook
+_workbook_formats: WeakKeyDictionary[
+    xlsxwriter.Workbook, dict[FormatType, xlsxwriter.format.Format]
+] = WeakKeyDictionary()
+
+
 def initialize_formats(
     workbook: xlsxwriter.Workbook,
 ) -> dict[FormatType, xlsxwriter.format.Format]:
@@ -49,7 +58,15 @@ def initialize_formats(
 
     Returns:
         (dict[FormatType, xlsxwriter.format.Format]): A dictionary of formats.
+
+    Notes:
+        - The formats are added to a workbook once; later calls for the same workbook return the same dictionary
+          instead of adding duplicate formats.
     """
+    cached_formats = _workbook_formats.get(workbook)
+    if cached_formats is not None:
+        return cached_formats
+
     formats: dict[FormatType, xlsxwriter.format.Format] = {
         FormatType.HEADER: workbook.add_format({"bold": True}),
         FormatType.DATE: workbook.add_format({"num_format": "mm/dd/yyyy"}),
@@ -61,4 +78,5 @@ def initialize_formats(
             {"bg_color": "#daf2d0", "font_color": "blue", "underline": True}
         ),
     }
+    _workbook_formats[workbook] = formats
     return formats
@@ -0,0 +1,74 @@
+import re
+import struct
+import zipfile
+import zlib
+
+import pytest
+
+pytest.importorskip("xlsxwriter")
+pytest.importorskip("my_libs.dependencies")
+
+from my_libs.terapeak.terapeak_xlsx_writer import (
+    DaysRange,
+    MyTerapeakExcel,
+    TerapeakData,
+)
+
+
+def make_png(path) -> None:
+    """
+    Write a valid 1x1 PNG image to `path`.
+    """
+
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + chunk_type
+            + data
+            + struct.pack(">I", zlib.crc32(chunk_type + data))
+        )
+
+    ihdr = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    idat = zlib.compress(b"\x00\xff\x00\x00")
+    path.write_bytes(
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", ihdr)
+        + chunk(b"IDAT", idat)
+        + chunk(b"IEND", b"")
+    )
+
+
+def make_row(image_path: str) -> dict:
+    return {
+        TerapeakData.TITLE: "Test item",
+        TerapeakData.TITLE_HREF: "https://www.ebay.com/itm/1",
+        TerapeakData.KEYWORD: "test",
+        TerapeakData.AVG_SOLD_PRICE: 12.5,
+        TerapeakData.AVG_SHIPPING_COST: 3.0,
+        TerapeakData.TOTAL_SOLD: 4,
+        TerapeakData.ITEM_SALES: 50.0,
+        TerapeakData.DATE_LAST_SOLD: None,
+        TerapeakData.IMAGE_URL: None,
+        TerapeakData.IMAGE_PATH: image_path,
+    }
+
+
+def test_saved_workbook_embeds_images_in_first_column(tmp_path):
+    image_path = tmp_path / "image.png"
+    make_png(image_path)
+
+    excel = MyTerapeakExcel("test", str(tmp_path))
+    excel.write_data_rows(DaysRange.THIRTY, [make_row(str(image_path))])
+    excel.write_data_rows(DaysRange.NINETY, [make_row(str(image_path))])
+    excel.write_total_sold(DaysRange.THIRTY, 4)
+    MyTerapeakExcel.clear_image_cache()
+
+    saved_file = excel.save_workbook()
+    assert saved_file == str(tmp_path / "test.xlsx")
+
+    with zipfile.ZipFile(saved_file) as workbook_file:
+        for sheet_file in ("xl/worksheets/sheet1.xml", "xl/worksheets/sheet2.xml"):
+            sheet_xml = workbook_file.read(sheet_file).decode()
+            # Embedded images are error cells that point to a rich value image
+            assert re.search(r'<c r="A2"[^>]* t="e" vm="\d+"', sheet_xml)
+        assert "xl/media/image1.png" in workbook_file.namelist()